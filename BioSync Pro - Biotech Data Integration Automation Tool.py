@@ -3,51 +3,276 @@ import pandas as pd
 import logging
 import click
 import os 
+import sys
+import io
+import csv
+import glob
+import gzip
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 
-logging.basicConfig(filename='app.log', filemode='w', format='%(name)s - %(levelname)s - %(message)s')
+# INFO keeps migration notices, import/export totals and sync metrics; runs append to the same log
+logging.basicConfig(filename='app.log', filemode='a', level=logging.INFO,
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-def create_sqlite_db(db_name):
-    try:
-        # Connect to SQLite database (or create if it doesn't exist)
-        conn = sqlite3.connect(f"{db_name}.db")
+# Columns of the sample_data table, in insertion order
+SAMPLE_COLUMNS = ['id', 'name', 'type', 'description']
+
+# Rows sent to executemany per call during bulk ingestion
+BULK_BATCH_SIZE = 50000
+
+# Rows fetched from the cursor per batch during export
+EXPORT_BATCH_SIZE = 50000
+
+# Chunks buffered between the sync readers and the single writer; a full queue blocks the readers
+SYNC_QUEUE_SIZE = 8
+
+# Source types a sync config may list
+SYNC_SOURCE_TYPES = {'csv': 'path', 'sqlite': 'path', 'http': 'url'}
+
+# Sample types accepted by input validation
+SAMPLE_TYPES = ["DNA", "Protein", "Cell"]
+
+# Schema migrations as (version, statements); the backend records the last one applied
+# (PRAGMA user_version on SQLite), so each runs exactly once. Append new versions, never edit old ones.
+MIGRATIONS = [
+    (1, ['''CREATE TABLE IF NOT EXISTS sample_data (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                type TEXT,
+                description TEXT
+            )''']),
+    (2, [
+        'CREATE INDEX IF NOT EXISTS idx_sample_data_name ON sample_data (name)',
+        # Covers lookups by type (and type + name) without touching the table rows;
+        # being led by type it also serves as the index on type
+        'CREATE INDEX IF NOT EXISTS idx_sample_data_type_name ON sample_data (type, name, description)',
+    ]),
+    # Highest sample id written by each named incremental export
+    (3, ['''CREATE TABLE IF NOT EXISTS export_watermarks (
+                name TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL
+            )''']),
+    # Change tracking for incremental exports: every load takes the next change_sequence value and
+    # stamps it on the rows it inserts or updates, so deltas also see updated samples
+    (4, [
+        'ALTER TABLE sample_data ADD COLUMN modified_seq INTEGER NOT NULL DEFAULT 0',
+        'CREATE INDEX IF NOT EXISTS idx_sample_data_modified_seq ON sample_data (modified_seq)',
+        'CREATE TABLE IF NOT EXISTS change_sequence (value INTEGER NOT NULL)',
+        'INSERT INTO change_sequence (value) VALUES (0)',
+        # Id watermarks missed updated rows, so the next delta of every export starts over
+        'ALTER TABLE export_watermarks RENAME COLUMN last_id TO last_seq',
+        'UPDATE export_watermarks SET last_seq = -1',
+    ]),
+]
+
+def tune_connection(conn):
+    # WAL lets readers work during ingestion; NORMAL sync is safe with WAL and avoids an fsync per commit
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+
+
+class SQLiteBackend:
+    placeholder = '?'
+    integrity_error = sqlite3.IntegrityError
+
+    def __init__(self, db_name):
+        self.name = f"{db_name}.db"
+
+    def connect(self):
+        # Transactions are opened explicitly by ConnectionManager.transaction; pooled connections
+        # move between threads, but only one thread holds a connection at a time
+        conn = sqlite3.connect(self.name, isolation_level=None, check_same_thread=False)
+        tune_connection(conn)
+        return conn
+
+    def begin(self, conn):
+        conn.execute('BEGIN')
+
+    def get_schema_version(self, conn):
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def set_schema_version(self, conn, version):
+        conn.execute(f'PRAGMA user_version = {int(version)}')
+
+    def describe_table(self, conn, table_name):
+        return conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+
+    def stream_cursor(self, conn):
+        # sqlite3 steps through the result as rows are fetched
+        return conn.cursor()
+
+
+class PostgresBackend:
+    placeholder = '%s'
+
+    def __init__(self, dsn):
+        self.name = dsn
+
+    def connect(self):
+        import psycopg2
+        return psycopg2.connect(self.name)
+
+    @property
+    def integrity_error(self):
+        import psycopg2
+        return psycopg2.IntegrityError
+
+    def begin(self, conn):
+        # psycopg2 opens a transaction with the first statement
+        pass
+
+    def get_schema_version(self, conn):
         cursor = conn.cursor()
+        cursor.execute('CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)')
+        cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+        version = cursor.fetchone()[0]
+        conn.commit()
+        return version
 
-        # Drop the existing table if it exists
-        cursor.execute('DROP TABLE IF EXISTS sample_data')
+    def set_schema_version(self, conn, version):
+        conn.cursor().execute('INSERT INTO schema_version (version) VALUES (%s)', (version,))
 
-        # Create a new sample table with appropriate columns
-        cursor.execute('''CREATE TABLE sample_data (
-                            id INTEGER PRIMARY KEY,
-                            name TEXT,
-                            type TEXT,
-                            description TEXT
-                          )''')
-        print(f"Database '{db_name}.db' updated with a new table 'sample_data'.")
+    def describe_table(self, conn, table_name):
+        cursor = conn.cursor()
+        cursor.execute('SELECT column_name, data_type, is_nullable FROM information_schema.columns '
+                       'WHERE table_name = %s ORDER BY ordinal_position', (table_name,))
+        return cursor.fetchall()
 
-        # Query to check the structure of the table
-        cursor.execute("PRAGMA table_info(sample_data)")
-        columns = cursor.fetchall()
-        print("Table Structure: ")
-        for col in columns:
-            print(col)
+    def stream_cursor(self, conn):
+        # A named (server-side) cursor, so fetchmany pulls batches instead of the whole result
+        return conn.cursor(name='biosync_export')
+
+
+class ConnectionManager:
+    # Small pool of backend connections: a thread checks one out for as long as it needs it
+    # (nested use in the same thread reuses it), and connection setup such as pragmas runs once
+
+    def __init__(self, backend, pool_size=4):
+        self.backend = backend
+        self.pool_size = pool_size
+        self.idle = queue.LifoQueue()
+        self.opened = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def checkout(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            can_open = len(self.opened) < self.pool_size
+            if can_open:
+                # Reserve the slot before connecting so concurrent threads respect the limit
+                self.opened.append(None)
+        if not can_open:
+            return self.idle.get()
+        try:
+            conn = self.backend.connect()
+        except Exception:
+            with self.lock:
+                self.opened.remove(None)
+            raise
+        with self.lock:
+            self.opened[self.opened.index(None)] = conn
+        return conn
+
+    @contextmanager
+    def connection(self):
+        held = getattr(self.local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+        conn = self.checkout()
+        self.local.conn = conn
+        try:
+            yield conn
+        finally:
+            self.local.conn = None
+            self.idle.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            if getattr(self.local, 'in_transaction', False):
+                # Joined into the enclosing transaction
+                yield conn
+                return
+            self.backend.begin(conn)
+            self.local.in_transaction = True
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self.local.in_transaction = False
+
+    def close(self):
+        with self.lock:
+            for conn in self.opened:
+                if conn is not None:
+                    conn.close()
+            self.opened = []
+        self.idle = queue.LifoQueue()
 
-        # Clean up
-        cursor.close()
-        conn.close()
 
+def open_database(db_name, backend='sqlite', dsn=None, pool_size=4):
+    try:
+        if backend == 'postgres':
+            db = ConnectionManager(PostgresBackend(dsn), pool_size)
+        else:
+            db = ConnectionManager(SQLiteBackend(db_name), pool_size)
+        # Open the first connection now so connection problems surface immediately
+        with db.connection():
+            pass
+        print(f"Connected to {backend} database '{db.backend.name}' successfully.")
+        return db
     except Exception as e:
-        logging.error(f"Failed to create database '{db_name}': {e}")
+        logging.error(f"Failed to connect to database '{db_name}': {e}")
         raise
 
 
-def connect_to_sqlite_db(db_name):
+def apply_migrations(db):
+    with db.connection() as conn:
+        current_version = db.backend.get_schema_version(conn)
+    for version, statements in MIGRATIONS:
+        if version <= current_version:
+            continue
+        # Each migration and its version bump commit together or not at all
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.close()
+            db.backend.set_schema_version(conn, version)
+        logging.info(f"Applied schema migration {version}")
+        current_version = version
+    return current_version
+
+
+def create_sqlite_db(db):
     try:
-        # Connect to SQLite database
-        conn = sqlite3.connect(f"{db_name}.db")
-        print(f"Connected to SQLite database '{db_name}.db' successfully.")
-        return conn
+        # Bring the schema up to date without touching existing rows
+        version = apply_migrations(db)
+        print(f"Database '{db.backend.name}' is at schema version {version}.")
+
+        # Query to check the structure of the table
+        with db.connection() as conn:
+            columns = db.backend.describe_table(conn, 'sample_data')
+        print("Table Structure: ")
+        for col in columns:
+            print(col)
+
     except Exception as e:
-        logging.error(f"Failed to connect to database '{db_name}': {e}")
+        logging.error(f"Failed to create database '{db.backend.name}': {e}")
         raise
 
 
@@ -78,18 +303,53 @@ def get_valid_input(prompt, expected_type, condition=lambda x: True):
         except ValueError:
             print(f"Invalid input. Please enter a valid {expected_type.__name__}.")
 
-def insert_data_to_db(conn, data, table_name, csv_filename):
+def bulk_insert_samples(db, data, table_name='sample_data', upsert=False, batch_size=BULK_BATCH_SIZE):
+    if not table_name.isidentifier():
+        raise ValueError(f"Invalid table name '{table_name}'")
+    columns = ', '.join(SAMPLE_COLUMNS + ['modified_seq'])
+    placeholders = ', '.join(db.backend.placeholder for _ in SAMPLE_COLUMNS + ['modified_seq'])
+    # One statement text for every batch, so the driver prepares it once and reuses it
+    sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    if upsert:
+        updates = ', '.join(f"{col} = excluded.{col}" for col in SAMPLE_COLUMNS + ['modified_seq'] if col != 'id')
+        sql += f" ON CONFLICT(id) DO UPDATE SET {updates}"
+
+    if isinstance(data, pd.DataFrame):
+        rows = data[SAMPLE_COLUMNS].astype(object).where(data[SAMPLE_COLUMNS].notna(), None).itertuples(index=False, name=None)
+    else:
+        rows = iter(data)
+
+    inserted = 0
     try:
-        # Insert data into the database
-        data.to_sql(table_name, conn, if_exists='append', index=False)
+        # A single transaction for the whole load: one commit instead of one per row
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            # The counter row stays locked until commit, so loads get their change numbers in commit order
+            cursor.execute('UPDATE change_sequence SET value = value + 1')
+            cursor.execute('SELECT value FROM change_sequence')
+            change_seq = cursor.fetchone()[0]
+            while True:
+                batch = [tuple(row) + (change_seq,) for row in islice(rows, batch_size)]
+                if not batch:
+                    break
+                cursor.executemany(sql, batch)
+                inserted += len(batch)
+            cursor.close()
+    except Exception as e:
+        logging.error(f"Bulk insert into '{table_name}' failed and was rolled back: {e}")
+        raise
+    return inserted
+
+
+def insert_data_to_db(db, data, table_name, csv_filename):
+    try:
+        # Insert data into the database, updating samples that already exist
+        bulk_insert_samples(db, data, table_name, upsert=True)
         print(f"Data inserted successfully into table '{table_name}'.")
 
-        # Get the absolute path to the directory where the script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # Combine the script directory with the CSV filename to get the absolute file path
-        csv_file_path = os.path.join(script_dir, csv_filename)
-        
+        # Relative filenames are taken from the working directory, like every other path the tool accepts
+        csv_file_path = os.path.abspath(csv_filename)
+
         # Export data to the CSV file using the absolute file path
         data.to_csv(csv_file_path, index=False)
         print(f"Data exported to '{csv_file_path}'.")
@@ -97,20 +357,405 @@ def insert_data_to_db(conn, data, table_name, csv_filename):
         logging.error(f"Error inserting data into '{table_name}': {e}")
         raise
 
-@click.command()
+def iter_sample_chunks(source, file_format='auto', chunksize=100000):
+    # '-' reads from stdin; 'auto' picks the format from the file extension
+    if file_format == 'auto':
+        if source.endswith(('.parquet', '.pq')):
+            file_format = 'parquet'
+        elif source.endswith(('.tsv', '.tab')):
+            file_format = 'tsv'
+        else:
+            file_format = 'csv'
+    handle = sys.stdin if source == '-' else source
+
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        if source == '-':
+            # Parquet needs a seekable input, so stdin is buffered first
+            handle = io.BytesIO(sys.stdin.buffer.read())
+        for batch in pq.ParquetFile(handle).iter_batches(batch_size=chunksize, columns=SAMPLE_COLUMNS):
+            yield batch.to_pandas()
+    else:
+        sep = '\t' if file_format == 'tsv' else ','
+        reader = pd.read_csv(handle, sep=sep, usecols=SAMPLE_COLUMNS, dtype=str,
+                             keep_default_na=False, chunksize=chunksize)
+        for chunk in reader:
+            yield chunk
+
+
+def validate_sample_chunk(chunk):
+    # Same rules as the interactive prompts, applied to a whole chunk at once
+    id_text = chunk['id'].astype(str).str.strip()
+    is_integer = id_text.str.fullmatch(r'[+-]?\d+').astype(bool)
+    # Parsed as Python ints, not floats, so large ids stay exact and '1e3' or '5.0' are rejected
+    ids = id_text[is_integer].map(int)
+    in_range = ids.map(lambda i: -2**63 <= i < 2**63).reindex(chunk.index, fill_value=True).astype(bool)
+    names = chunk['name'].astype(str)
+    types = chunk['type'].astype(str)
+    checks = {
+        'id is not an integer': ~is_integer,
+        'id is out of range': ~in_range,
+        'name must be alphanumeric': ~names.str.fullmatch(r'[\w ]*'),
+        f"type must be one of {', '.join(SAMPLE_TYPES)}": ~types.isin(SAMPLE_TYPES),
+    }
+    reasons = pd.Series('', index=chunk.index)
+    for reason, failed in checks.items():
+        reasons = reasons.where(~failed, reasons + reason + '; ')
+    rejected = reasons != ''
+
+    accepted = chunk.loc[~rejected, SAMPLE_COLUMNS].copy()
+    accepted['id'] = ids.loc[accepted.index].astype('int64')
+    accepted['description'] = accepted['description'].replace('', None)
+    rejected_rows = chunk.loc[rejected].assign(reason=reasons[rejected].str.rstrip('; '))
+    return accepted, rejected_rows
+
+
+def start_rejects_file(rejects_path):
+    # Each run reports only its own rejects, appended chunk by chunk from here on
+    if os.path.exists(rejects_path):
+        os.remove(rejects_path)
+
+
+def import_samples(db, source, file_format='auto', chunksize=100000, rejects_path='rejected_rows.csv', upsert=False):
+    accepted_total = 0
+    rejected_total = 0
+    for chunk in iter_sample_chunks(source, file_format, chunksize):
+        accepted, rejected = validate_sample_chunk(chunk)
+        # Rejects are recorded first so they survive a chunk whose insert fails
+        if len(rejected):
+            write_header = not os.path.exists(rejects_path) or os.path.getsize(rejects_path) == 0
+            rejected.to_csv(rejects_path, mode='a', header=write_header, index=False)
+            rejected_total += len(rejected)
+        if len(accepted):
+            try:
+                accepted_total += bulk_insert_samples(db, accepted, 'sample_data', upsert=upsert)
+            except db.backend.integrity_error as e:
+                raise click.ClickException(
+                    f"'{source}': {e}. {accepted_total} rows from this source were committed before the "
+                    f"failing chunk was rolled back; use --upsert to update samples that already exist."
+                )
+    logging.info(f"Imported {accepted_total} rows from '{source}', rejected {rejected_total}")
+    return accepted_total, rejected_total
+
+
+def export_format_for(output_path, file_format='auto'):
+    if file_format != 'auto':
+        return file_format
+    if output_path.endswith(('.parquet', '.pq')):
+        return 'parquet'
+    if output_path.endswith('.gz'):
+        return 'csv.gz'
+    return 'csv'
+
+
+def write_export_batches(batches, output_path, file_format):
+    # Writes each fetched batch as it arrives; returns the number of rows written
+    rows_written = 0
+    if file_format == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        schema = pa.schema([('id', pa.int64()), ('name', pa.string()), ('type', pa.string()), ('description', pa.string())])
+        with pq.ParquetWriter(output_path, schema) as writer:
+            for batch in batches:
+                columns = [pa.array(values, type=field.type) for values, field in zip(zip(*batch), schema)]
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                rows_written += len(batch)
+            if not rows_written:
+                # Still produce a readable file with the schema when nothing matched
+                writer.write_table(schema.empty_table())
+    else:
+        opener = gzip.open if file_format == 'csv.gz' else open
+        with opener(output_path, 'wt', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(SAMPLE_COLUMNS)
+            for batch in batches:
+                writer.writerows(batch)
+                rows_written += len(batch)
+    return rows_written
+
+
+def export_samples(db, output_path, file_format='auto', where=None, params=(), since_last=None,
+                   batch_size=EXPORT_BATCH_SIZE):
+    file_format = export_format_for(output_path, file_format)
+    conditions = [f"({where})"] if where else []
+    params = list(params)
+
+    tmp_path = f"{output_path}.tmp"
+    try:
+        # One transaction gives the read a consistent snapshot and advances the watermark with it
+        with db.transaction() as conn:
+            placeholder = db.backend.placeholder
+            if since_last:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT last_seq FROM export_watermarks WHERE name = {placeholder}", (since_last,))
+                found = cursor.fetchone()
+                # The delta covers the changes committed up to now, bounded so that loads committing
+                # while it is written are left for the next one
+                cursor.execute('SELECT MAX(modified_seq) FROM sample_data')
+                current_seq = cursor.fetchone()[0]
+                cursor.close()
+                if found is not None:
+                    conditions.append(f"modified_seq > {placeholder}")
+                    params.append(found[0])
+                if current_seq is not None:
+                    conditions.append(f"modified_seq <= {placeholder}")
+                    params.append(current_seq)
+
+            sql = f"SELECT {', '.join(SAMPLE_COLUMNS)} FROM sample_data"
+            if conditions:
+                sql += " WHERE " + " AND ".join(conditions)
+            sql += " ORDER BY id"
+
+            cursor = db.backend.stream_cursor(conn)
+            cursor.execute(sql, params)
+            batches = iter(lambda: cursor.fetchmany(batch_size), [])
+            rows_written = write_export_batches(batches, tmp_path, file_format)
+            cursor.close()
+            os.replace(tmp_path, output_path)
+
+            if since_last and current_seq is not None:
+                conn.cursor().execute(
+                    f"INSERT INTO export_watermarks (name, last_seq) VALUES ({placeholder}, {placeholder}) "
+                    "ON CONFLICT(name) DO UPDATE SET last_seq = excluded.last_seq",
+                    (since_last, current_seq))
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logging.error(f"Export to '{output_path}' failed: {e}")
+        raise
+    logging.info(f"Exported {rows_written} rows to '{output_path}'")
+    return rows_written
+
+
+def iter_sqlite_chunks(path, table_name='sample_data', chunksize=100000):
+    if not table_name.isidentifier():
+        raise ValueError(f"Invalid table name '{table_name}'")
+    # Read-only, so pulling from a live instrument database never takes a write lock
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(f"SELECT {', '.join(SAMPLE_COLUMNS)} FROM {table_name}")
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            # Same all-text shape as the file readers, so validation treats every source alike
+            yield pd.DataFrame(rows, columns=SAMPLE_COLUMNS, dtype=object).fillna('').astype(str)
+    finally:
+        conn.close()
+
+
+def iter_http_chunks(url, chunksize=100000, timeout=30):
+    from urllib.request import urlopen
+    with urlopen(url, timeout=timeout) as response:
+        reader = pd.read_csv(response, usecols=SAMPLE_COLUMNS, dtype=str,
+                             keep_default_na=False, chunksize=chunksize)
+        for chunk in reader:
+            yield chunk
+
+
+def iter_source_chunks(source, chunksize=100000):
+    if source['type'] == 'csv':
+        # A drop directory pattern; every file present when the sync starts is read in name order
+        for path in sorted(glob.glob(source['path'])):
+            yield from iter_sample_chunks(path, source.get('format', 'auto'), chunksize)
+    elif source['type'] == 'sqlite':
+        yield from iter_sqlite_chunks(source['path'], source.get('table', 'sample_data'), chunksize)
+    else:
+        yield from iter_http_chunks(source['url'], chunksize, source.get('timeout', 30))
+
+
+def load_sync_config(config_path):
+    with open(config_path) as f:
+        config = json.load(f)
+    sources = config.get('sources', [])
+    names = set()
+    for source in sources:
+        kind = source.get('type')
+        if kind not in SYNC_SOURCE_TYPES:
+            raise ValueError(f"Unknown source type '{kind}' in '{config_path}'")
+        if SYNC_SOURCE_TYPES[kind] not in source:
+            raise ValueError(f"Source of type '{kind}' needs a '{SYNC_SOURCE_TYPES[kind]}' entry")
+        source.setdefault('name', source[SYNC_SOURCE_TYPES[kind]])
+        if source['name'] in names:
+            raise ValueError(f"Duplicate source name '{source['name']}' in '{config_path}'")
+        names.add(source['name'])
+    return config
+
+
+def sync_sources(db, sources, workers=4, queue_size=SYNC_QUEUE_SIZE, chunksize=100000,
+                 rejects_path='rejected_rows.csv', upsert=True):
+    # Readers pull every source concurrently; only this thread writes, one transaction per chunk
+    work = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    metrics = {source['name']: {'rows': 0, 'rejected': 0, 'chunks': 0, 'max_lag': 0.0, 'total_lag': 0.0,
+                                'started': None, 'finished': None, 'error': None}
+               for source in sources}
+
+    def put(item):
+        # Blocks while the writer is behind, but gives up once the sync has been aborted
+        while not stop.is_set():
+            try:
+                work.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pull(source):
+        stats = metrics[source['name']]
+        stats['started'] = time.monotonic()
+        try:
+            for chunk in iter_source_chunks(source, chunksize):
+                if not put((source['name'], chunk, time.monotonic())):
+                    return
+        except Exception as e:
+            # A failing source is reported but does not stop the others
+            stats['error'] = str(e)
+            logging.error(f"Sync source '{source['name']}' failed: {e}")
+        finally:
+            put((source['name'], None, None))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='biosync-sync') as pool:
+        for source in sources:
+            pool.submit(pull, source)
+        remaining = len(sources)
+        try:
+            while remaining:
+                name, chunk, read_at = work.get()
+                stats = metrics[name]
+                if chunk is None:
+                    stats['finished'] = time.monotonic()
+                    remaining -= 1
+                    log_source_metrics(name, stats)
+                    continue
+                accepted, rejected = validate_sample_chunk(chunk)
+                if len(rejected):
+                    write_header = not os.path.exists(rejects_path) or os.path.getsize(rejects_path) == 0
+                    rejected.assign(source=name).to_csv(rejects_path, mode='a', header=write_header, index=False)
+                    stats['rejected'] += len(rejected)
+                if len(accepted):
+                    try:
+                        stats['rows'] += bulk_insert_samples(db, accepted, 'sample_data', upsert=upsert)
+                    except db.backend.integrity_error as e:
+                        raise click.ClickException(
+                            f"'{name}': {e}. {stats['rows']} rows from this source were committed before the "
+                            f"failing chunk was rolled back; use --upsert to update samples that already exist."
+                        )
+                # Lag: time from a chunk being read at the source to its rows being committed
+                lag = time.monotonic() - read_at
+                stats['chunks'] += 1
+                stats['total_lag'] += lag
+                stats['max_lag'] = max(stats['max_lag'], lag)
+        except BaseException:
+            stop.set()
+            raise
+    return metrics
+
+
+def log_source_metrics(name, stats):
+    elapsed = max(stats['finished'] - stats['started'], 1e-9)
+    mean_lag = stats['total_lag'] / stats['chunks'] if stats['chunks'] else 0.0
+    message = (f"Sync source '{name}': {stats['rows']} rows, {stats['rejected']} rejected in {elapsed:.2f}s "
+               f"({stats['rows'] / elapsed:,.0f} rows/s), lag mean {mean_lag:.3f}s max {stats['max_lag']:.3f}s")
+    if stats['error']:
+        message += f", failed: {stats['error']}"
+    logging.info(message)
+    print(message)
+
+
+@click.group(invoke_without_command=True)
 @click.option('--db_name', default='my_database', help='Database name')
-def main(db_name):
+@click.option('--backend', type=click.Choice(['sqlite', 'postgres']), default='sqlite', help='Database backend')
+@click.option('--dsn', default=None, help='PostgreSQL connection string (postgres backend only)')
+@click.option('--pool_size', default=4, help='Maximum number of pooled database connections')
+@click.pass_context
+def main(ctx, db_name, backend, dsn, pool_size):
+    # One connection manager shared by every step of the run and closed when it ends
+    db = open_database(db_name, backend, dsn, pool_size)
+    ctx.call_on_close(db.close)
+    ctx.obj = {'db': db}
+    if ctx.invoked_subcommand is not None:
+        return
+
     # Create the database and insert data as usual
-    create_sqlite_db(db_name)
-    conn = connect_to_sqlite_db(db_name)
+    create_sqlite_db(db)
     biotech_data = input_biotech_data()
 
     # Allow the user to input the CSV file name
     csv_filename = input("Enter the name for the CSV file (e.g., biotech_data.csv): ")
 
     # Call the function to insert data and export it to CSV with the specified filename
-    insert_data_to_db(conn, biotech_data, 'sample_data', csv_filename)
+    insert_data_to_db(db, biotech_data, 'sample_data', csv_filename)
     print(f"Data has been exported to {csv_filename}")
 
+
+@main.command('import')
+@click.argument('sources', nargs=-1, required=True)
+@click.option('--format', 'file_format', type=click.Choice(['auto', 'csv', 'tsv', 'parquet']), default='auto',
+              help='Input format (auto detects from the file extension)')
+@click.option('--chunksize', default=100000, help='Rows read and validated per chunk')
+@click.option('--rejects', default='rejected_rows.csv', help='CSV file receiving rows that fail validation')
+@click.option('--upsert', is_flag=True, help='Update existing samples with the same id instead of failing')
+@click.pass_context
+def import_command(ctx, sources, file_format, chunksize, rejects, upsert):
+    """Import samples from CSV/TSV/Parquet files, or '-' for stdin."""
+    db = ctx.obj['db']
+    apply_migrations(db)
+    start_rejects_file(rejects)
+    rejected_total = 0
+    for source in sources:
+        accepted, rejected = import_samples(db, source, file_format, chunksize, rejects, upsert)
+        print(f"'{source}': {accepted} rows imported, {rejected} rows rejected.")
+        rejected_total += rejected
+    if rejected_total:
+        print(f"Rejected rows were written to '{rejects}'.")
+
+
+@main.command('export')
+@click.argument('output')
+@click.option('--format', 'file_format', type=click.Choice(['auto', 'csv', 'csv.gz', 'parquet']), default='auto',
+              help='Output format (auto detects from the file extension)')
+@click.option('--where', default=None, help="SQL filter on sample_data, e.g. \"type = ?\"")
+@click.option('--param', 'params', multiple=True, help='Value bound to a placeholder in --where (repeatable)')
+@click.option('--since_last', default=None,
+              help='Watermark name: export only samples inserted or updated since the last export under this name')
+@click.option('--batch_size', default=EXPORT_BATCH_SIZE, help='Rows fetched from the database per batch')
+@click.pass_context
+def export_command(ctx, output, file_format, where, params, since_last, batch_size):
+    """Stream sample_data to a CSV, gzip-CSV or Parquet file."""
+    db = ctx.obj['db']
+    apply_migrations(db)
+    rows = export_samples(db, output, file_format, where, params, since_last, batch_size)
+    print(f"{rows} rows exported to '{output}'.")
+
+
+@main.command('sync')
+@click.argument('config_path')
+@click.option('--workers', default=None, type=int, help='Sources pulled concurrently (default: config value or 4)')
+@click.option('--queue_size', default=None, type=int, help='Chunks buffered ahead of the writer before readers block')
+@click.option('--chunksize', default=None, type=int, help='Rows read from a source per chunk')
+@click.option('--rejects', default='rejected_rows.csv', help='CSV file receiving rows that fail validation')
+@click.option('--upsert/--insert_only', default=True, help='Update samples that already exist (default) or fail on them')
+@click.pass_context
+def sync_command(ctx, config_path, workers, queue_size, chunksize, rejects, upsert):
+    """Pull every source listed in a JSON sync config into the database."""
+    config = load_sync_config(config_path)
+    db = ctx.obj['db']
+    apply_migrations(db)
+    start_rejects_file(rejects)
+    started = time.monotonic()
+    metrics = sync_sources(db, config['sources'],
+                           workers or config.get('workers', 4),
+                           queue_size or config.get('queue_size', SYNC_QUEUE_SIZE),
+                           chunksize or config.get('chunksize', 100000),
+                           rejects, upsert)
+    total = sum(stats['rows'] for stats in metrics.values())
+    failed = [name for name, stats in metrics.items() if stats['error']]
+    print(f"{total} rows synced from {len(metrics)} sources in {time.monotonic() - started:.2f}s.")
+    if any(stats['rejected'] for stats in metrics.values()):
+        print(f"Rejected rows were written to '{rejects}'.")
+    if failed:
+        raise click.ClickException(f"Sources failed: {', '.join(failed)}")
+
 if __name__ == "__main__":
     main()
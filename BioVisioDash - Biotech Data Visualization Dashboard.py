@@ -1,16 +1,18 @@
+import argparse
 import dash
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html, Patch
 from dash.dependencies import Input, Output, State
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objs as go
 
 # Create a Dash application
 app = dash.Dash(__name__)
 
-# Initialize an empty DataFrame to hold the data
-df = pd.DataFrame(columns=['X', 'Y'])
+# WSGI application served by run_production (--production); the file name is not importable
+# as a module, so any other WSGI runner has to load this file by path
+server = app.server
+
+# Cache lifetime in seconds for static assets served in production
+ASSET_MAX_AGE = 24 * 60 * 60
 
 # Define the layout of the dashboard with a biotech theme
 app.layout = html.Div([
@@ -32,40 +34,110 @@ app.layout = html.Div([
         style={'margin': '10px'}
     ),
 
+    # Data points of this browser session only; the server keeps no shared state
+    dcc.Store(id='session-data', storage_type='session', data={'X': [], 'Y': []}),
+
     dcc.Graph(id='chart-output')  # Add chart-output graph
 ])
 
-@app.callback(
-    Output('chart-output', 'figure'),
-    Input('x-input', 'value'),
-    Input('y-input', 'value'),
-    Input('add-data-button', 'n_clicks'),
-    Input('chart-type', 'value'),
-    State('chart-output', 'figure')
-)
-def update_chart(x_value, y_value, n_clicks, chart_type, existing_figure):
-    if n_clicks > 0 and x_value is not None and y_value is not None:
-        df.loc[len(df)] = [x_value, y_value]
+# Trace properties holding the X and Y values of each chart type; the line chart
+# plots Y against the point number, so it only stores Y
+TRACE_FIELDS = {
+    'scatter': ('x', 'y'),
+    'bar': ('x', 'y'),
+    'pie': ('labels', 'values'),
+    'line': (None, 'y'),
+}
+
+# Function to build a chart as one trace holding every data point
+def build_figure(data, chart_type):
+    x_values = list(data.get('X', [])) if data else []
+    y_values = list(data.get('Y', [])) if data else []
 
     if chart_type == 'scatter':
-        fig = go.Figure()
-        for i, row in df.iterrows():
-            fig.add_trace(go.Scatter(x=[row['X']], y=[row['Y']], mode='markers', name=f'Data Set {i + 1}'))
+        fig = go.Figure(go.Scatter(x=x_values, y=y_values, mode='markers', name='Data Sets'))
         fig.update_layout(title='Scatter Plot')
     elif chart_type == 'bar':
-        fig = px.bar(df, x='X', y='Y', title='Bar Chart')
+        fig = go.Figure(go.Bar(x=x_values, y=y_values, name='Data Sets'))
+        fig.update_layout(title='Bar Chart', xaxis_title='X', yaxis_title='Y')
     elif chart_type == 'pie':
-        fig = px.pie(df, names='X', values='Y', title='Pie Chart')
+        fig = go.Figure(go.Pie(labels=x_values, values=y_values))
+        fig.update_layout(title='Pie Chart')
     elif chart_type == 'line':
-        fig = go.Figure()
-        for i, row in df.iterrows():
-            fig.add_trace(go.Scatter(x=list(range(1, len(df) + 1)), y=df['Y'], mode='lines+markers', name=f'Data Set {i + 1}'))
+        fig = go.Figure(go.Scatter(y=y_values, x0=1, dx=1, mode='lines+markers', name='Data Sets'))
         fig.update_layout(title='Line Chart')
     else:
         fig = go.Figure()
 
     return fig
 
-# Run the app
+# Append only the new point to the session store and to the chart when the button is clicked
+@app.callback(
+    Output('session-data', 'data'),
+    Output('chart-output', 'figure', allow_duplicate=True),
+    Input('add-data-button', 'n_clicks'),
+    State('x-input', 'value'),
+    State('y-input', 'value'),
+    State('chart-type', 'value'),
+    prevent_initial_call=True
+)
+def add_data_point(n_clicks, x_value, y_value, chart_type):
+    if x_value is None or y_value is None:
+        return dash.no_update, dash.no_update
+    # Patches send just the appended values instead of the whole data set or figure
+    data_patch = Patch()
+    data_patch['X'].append(x_value)
+    data_patch['Y'].append(y_value)
+    if chart_type not in TRACE_FIELDS:
+        return data_patch, dash.no_update
+    figure_patch = Patch()
+    x_field, y_field = TRACE_FIELDS[chart_type]
+    if x_field:
+        figure_patch['data'][0][x_field].append(x_value)
+    figure_patch['data'][0][y_field].append(y_value)
+    return data_patch, figure_patch
+
+# Rebuild the whole chart only when the chart type changes or the page loads
+@app.callback(
+    Output('chart-output', 'figure'),
+    Input('chart-type', 'value'),
+    State('session-data', 'data')
+)
+def update_chart(chart_type, data):
+    return build_figure(data, chart_type)
+
+# Function to serve the app under gunicorn with several worker processes and threads
+def run_production(host, port, workers, threads):
+    from flask_compress import Compress
+    from gunicorn.app.base import BaseApplication
+
+    # Compress callback responses and let browsers cache static assets
+    Compress(server)
+    server.config['SEND_FILE_MAX_AGE_DEFAULT'] = ASSET_MAX_AGE
+
+    class DashApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('preload_app', True)
+
+        def load(self):
+            return server
+
+    DashApplication().run()
+
+# Run the application
 if __name__ == '__main__':
-    app.run_server(debug=True)
+    parser = argparse.ArgumentParser(description="BioVisioDash - Biotech Data Visualization Dashboard")
+    parser.add_argument('--production', action='store_true', help='Serve with gunicorn instead of the debug server')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    parser.add_argument('--port', type=int, default=8050, help='Port to bind')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes in production mode')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per worker in production mode')
+    args = parser.parse_args()
+
+    if args.production:
+        run_production(args.host, args.port, args.workers, args.threads)
+    else:
+        app.run(debug=True, host=args.host, port=args.port)
@@ -1,9 +1,43 @@
 # Import necessary libraries
+import argparse
+import functools
+import glob
+import gzip
+import io
+import itertools
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 from Bio import SeqIO
-from Bio.SeqUtils import GC
 from Bio.Seq import Seq
 from Bio.Align import PairwiseAligner
+from Bio.Data import CodonTable
+
+# Byte lookup table flagging the bases counted as GC (G, C and S, any case), as the classic Bio.SeqUtils.GC did
+GC_LOOKUP = np.zeros(256, dtype=np.uint8)
+GC_LOOKUP[np.frombuffer(b"GCSgcs", dtype=np.uint8)] = 1
+
+# Line-break and padding bytes that are not part of a sequence
+WHITESPACE_BYTES = np.frombuffer(b" \t\r\n", dtype=np.uint8)
+
+# Byte lookup table mapping A/C/G/T (any case) to 0-3 and every other byte to 4
+NUCLEOTIDES = "ACGT"
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+for code, base in enumerate(NUCLEOTIDES):
+  BASE_CODES[ord(base)] = code
+  BASE_CODES[ord(base.lower())] = code
+
+# Byte lookup table folding lowercase (soft-masked) bases to uppercase
+UPPERCASE_BYTES = np.arange(256, dtype=np.uint8)
+UPPERCASE_BYTES[ord("a"):ord("z") + 1] -= 32
+
+# IUPAC ambiguity codes other than N
+AMBIGUITY_CODES = "RYSWKMBDHV"
 
 # Function to input a DNA sequence from the user
 def input_dna_sequence():
@@ -14,30 +48,177 @@ def read_sequence_from_file(file_path):
   for record in SeqIO.parse(file_path, "fasta"):
     return str(record.seq).upper()
     
+# Function to open a sequence file as a binary stream, decompressing gzip/bgzip input
+def open_sequence_file(file_path):
+  with open(file_path, "rb") as handle:
+    magic = handle.read(2)
+  if magic == b"\x1f\x8b":
+    return gzip.open(file_path, "rb")
+  return open(file_path, "rb")
+
+# Function to yield one line of a binary stream as pieces of at most chunk_size bytes
+def read_line_chunks(handle, chunk_size):
+  while True:
+    chunk = handle.readline(chunk_size)
+    if not chunk:
+      return
+    yield chunk
+    if chunk.endswith(b"\n"):
+      return
+
+# Function to turn the byte histogram of a record into its length, GC% and base counts
+def summarize_record(record_id, byte_counts):
+  byte_counts = byte_counts.copy()
+  byte_counts[WHITESPACE_BYTES] = 0
+  length = int(byte_counts.sum())
+  gc_count = int(byte_counts[GC_LOOKUP == 1].sum())
+  counts = {base: int(byte_counts[ord(base)] + byte_counts[ord(base.lower())]) for base in "ATCGN"}
+  return {
+    "id": record_id,
+    "length": length,
+    "gc_content": gc_count * 100.0 / length if length else 0.0,
+    "counts": counts,
+  }
+
+# Function to summarise every record of a FASTA file, chunk by chunk
+def stream_fasta_records(handle, chunk_size):
+  record_id = None
+  byte_counts = None
+  at_line_start = True
+  while True:
+    chunk = handle.readline(chunk_size)
+    if not chunk:
+      break
+    if at_line_start and chunk.startswith(b">"):
+      if record_id is not None:
+        yield summarize_record(record_id, byte_counts)
+      header = chunk if chunk.endswith(b"\n") else chunk + b"".join(read_line_chunks(handle, chunk_size))
+      title = header[1:].decode("utf-8", "replace").split(None, 1)
+      record_id = title[0] if title else ""
+      byte_counts = np.zeros(256, dtype=np.int64)
+      continue
+    at_line_start = chunk.endswith(b"\n")
+    if byte_counts is not None:
+      byte_counts += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256)
+  if record_id is not None:
+    yield summarize_record(record_id, byte_counts)
+
+# Function to summarise every record of a four-line FASTQ file, chunk by chunk
+def stream_fastq_records(handle, chunk_size):
+  while True:
+    header = b"".join(read_line_chunks(handle, chunk_size))
+    if not header:
+      return
+    if not header.strip():
+      continue
+    if not header.startswith(b"@"):
+      raise ValueError(f"Malformed FASTQ header: {header[:50]!r}")
+    title = header[1:].decode("utf-8", "replace").split(None, 1)
+    byte_counts = np.zeros(256, dtype=np.int64)
+    for chunk in read_line_chunks(handle, chunk_size):
+      byte_counts += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256)
+    # Skip the '+' separator and the quality line without keeping them
+    for _ in read_line_chunks(handle, chunk_size):
+      pass
+    for _ in read_line_chunks(handle, chunk_size):
+      pass
+    yield summarize_record(title[0] if title else "", byte_counts)
+
+# Function to stream per-record length, GC and nucleotide counts from a FASTA/FASTQ file
+def stream_sequence_records(file_path, file_format=None, chunk_size=1 << 20):
+  with open_sequence_file(file_path) as handle:
+    if file_format is None:
+      file_format = "fastq" if handle.peek(1)[:1] == b"@" else "fasta"
+    if file_format == "fasta":
+      yield from stream_fasta_records(handle, chunk_size)
+    elif file_format == "fastq":
+      yield from stream_fastq_records(handle, chunk_size)
+    else:
+      raise ValueError(f"Unsupported sequence format: {file_format}")
+
 # Function to calculate the length of a DNA sequence
 def calculate_sequence_length(dna_sequence):
   return len(dna_sequence)
   
 # Function to calculate the GC content of a DNA sequence
-  def calculate_gc_content(dna_sequence):
-    return GC(dna_sequence)
+def calculate_gc_content(dna_sequence):
+  encoded = encode_sequence(dna_sequence)
+  if len(encoded) == 0:
+    return 0.0
+  return int(GC_LOOKUP[encoded].sum()) * 100.0 / len(encoded)
     
+# Function to encode a DNA sequence once as a NumPy uint8 array of ASCII codes
+def encode_sequence(dna_sequence):
+  if isinstance(dna_sequence, np.ndarray):
+    return dna_sequence.astype(np.uint8, copy=False)
+  if isinstance(dna_sequence, str):
+    dna_sequence = dna_sequence.encode("ascii")
+  elif not isinstance(dna_sequence, (bytes, bytearray, memoryview)):
+    dna_sequence = str(dna_sequence).encode("ascii")
+  return np.frombuffer(dna_sequence, dtype=np.uint8)
+
+# Function to compute the GC% of every sliding window in a single cumulative-sum pass
+def gc_profile(dna_sequence, window_size=50, step=1):
+  if window_size < 1 or step < 1:
+    raise ValueError("window_size and step must be positive integers")
+  encoded = encode_sequence(dna_sequence)
+  # Windows count G/C/S over their full width, exactly as calculate_gc_content does on each slice
+  if len(encoded) < window_size:
+    return np.empty(0, dtype=np.float64)
+  gc_cumsum = np.zeros(len(encoded) + 1, dtype=np.int64)
+  np.cumsum(GC_LOOKUP[encoded], out=gc_cumsum[1:])
+  starts = np.arange(0, len(encoded) - window_size + 1, step)
+  gc_counts = gc_cumsum[starts + window_size] - gc_cumsum[starts]
+  return gc_counts * 100.0 / window_size
+
 # Function to plot GC content
-def plot_gc_content(dna_sequence):
-# Adjust the window size if the sequence is shorter than 100 bases
-  window_size = min(50, len(dna_sequence) // 2)
-  gc_values = [GC(dna_sequence[i:i+window_size]) for i in
-  range(len(dna_sequence) - window_size + 1)]
-  plt.plot(gc_values)
+def plot_gc_content(dna_sequence, window_size=None, step=1):
+  # Adjust the window size if the sequence is shorter than 100 bases
+  if window_size is None:
+    window_size = max(1, min(50, len(dna_sequence) // 2))
+  gc_values = gc_profile(dna_sequence, window_size, step)
+  plt.plot(np.arange(len(gc_values)) * step, gc_values)
   plt.title("GC Content over Sequence")
   plt.xlabel("Position")
   plt.ylabel("GC%")
   plt.show()
   
+# Function to list the k-mers in the order used by count_kmers
+def kmer_labels(k):
+  return ["".join(kmer) for kmer in itertools.product(NUCLEOTIDES, repeat=k)]
+
+# Function to count every k-mer of a sequence into a 4**k array indexed like kmer_labels(k)
+def count_kmers(dna_sequence, k):
+  if k < 1:
+    raise ValueError("k must be a positive integer")
+  codes = BASE_CODES[encode_sequence(dna_sequence)]
+  n_windows = len(codes) - k + 1
+  if n_windows <= 0:
+    return np.zeros(4 ** k, dtype=np.int64)
+  # k-mers overlapping N or an ambiguity code are skipped
+  invalid_cumsum = np.zeros(len(codes) + 1, dtype=np.int64)
+  np.cumsum(codes == 4, out=invalid_cumsum[1:])
+  valid = invalid_cumsum[k:] == invalid_cumsum[:n_windows]
+  kmer_index = np.zeros(n_windows, dtype=np.int64)
+  for offset in range(k):
+    kmer_index = kmer_index * 4 + (codes[offset:offset + n_windows] & 3)
+  return np.bincount(kmer_index[valid], minlength=4 ** k)
+
+# Function to count mononucleotides, dinucleotides and k-mers of a sequence in one call
+def count_composition(dna_sequence, k=3):
+  encoded = encode_sequence(dna_sequence)
+  byte_counts = np.bincount(UPPERCASE_BYTES[encoded], minlength=256)
+  mononucleotides = {base: int(byte_counts[ord(base)]) for base in NUCLEOTIDES + "N"}
+  mononucleotides["ambiguous"] = int(sum(byte_counts[ord(code)] for code in AMBIGUITY_CODES))
+  dinucleotides = dict(zip(kmer_labels(2), count_kmers(encoded, 2).tolist()))
+  kmer_counts = count_kmers(encoded, k)
+  kmers = {label: int(count) for label, count in zip(kmer_labels(k), kmer_counts) if count}
+  return {"mononucleotide": mononucleotides, "dinucleotide": dinucleotides, "kmer": kmers}
+
 def plot_nucleotide_frequency(dna_sequence):
+  byte_counts = np.bincount(UPPERCASE_BYTES[encode_sequence(dna_sequence)], minlength=256)
   nucleotides = ['A', 'T', 'C', 'G']
-  frequencies = {nucleotide: dna_sequence.count(nucleotide) for nucleotide in
-  nucleotides}
+  frequencies = {nucleotide: int(byte_counts[ord(nucleotide)]) for nucleotide in nucleotides}
   plt.bar(frequencies.keys(), frequencies.values())
   plt.title("Nucleotide Frequency")
   plt.xlabel("Nucleotide")
@@ -45,10 +226,9 @@ def plot_nucleotide_frequency(dna_sequence):
   plt.show()
   
 def plot_gc_per_position(dna_sequence):
-  gc_flags = [1 if nucleotide in ['G', 'C'] else 0 for nucleotide in
-  dna_sequence]
-  plt.plot(gc_flags, 'ro-') # 'ro-' means red color, circle marker, and solid
-  line
+  codes = BASE_CODES[encode_sequence(dna_sequence)]
+  gc_flags = ((codes == 1) | (codes == 2)).astype(np.uint8)
+  plt.plot(gc_flags, 'ro-') # 'ro-' means red color, circle marker, and solid line
   plt.title("GC Presence per Position")
   plt.xlabel("Position")
   plt.ylabel("GC Present")
@@ -61,42 +241,289 @@ def predict_protein(dna_sequence):
   protein = dna_seq.translate()
   return str(protein)
   
-# Function to compare two DNA sequences
-def compare_sequences(seq1, seq2):
+# Function to build the amino-acid, start and stop lookup tables of an NCBI genetic code
+# Index 64 stands for any codon containing N or an ambiguity code and translates to X
+@functools.lru_cache(maxsize=None)
+def codon_lookup(table_id=1):
+  table = CodonTable.unambiguous_dna_by_id[table_id]
+  amino_acids = np.full(65, ord("X"), dtype=np.uint8)
+  is_start = np.zeros(65, dtype=bool)
+  is_stop = np.zeros(65, dtype=bool)
+  for index, codon in enumerate(kmer_labels(3)):
+    if codon in table.stop_codons:
+      amino_acids[index] = ord("*")
+      is_stop[index] = True
+    else:
+      amino_acids[index] = ord(table.forward_table[codon])
+    is_start[index] = codon in table.start_codons
+  return amino_acids, is_start, is_stop
+
+# Function to turn base codes into codon indices for one reading frame
+def codon_indices(codes, frame):
+  n_codons = (len(codes) - frame) // 3
+  codons = codes[frame:frame + 3 * n_codons].reshape(-1, 3).astype(np.int64)
+  indices = codons[:, 0] * 16 + codons[:, 1] * 4 + codons[:, 2]
+  indices[(codons == 4).any(axis=1)] = 64
+  return indices
+
+# Function to yield the base codes of the forward strand and of its reverse complement
+def strand_codes(dna_sequence):
+  codes = BASE_CODES[encode_sequence(dna_sequence)]
+  yield 1, codes
+  # A<->T and C<->G are 0<->3 and 1<->2; anything else stays 4
+  yield -1, np.where(codes < 4, 3 - codes, 4).astype(np.uint8)[::-1]
+
+# Function to translate all six reading frames, keyed +1, +2, +3, -1, -2, -3
+def translate_six_frames(dna_sequence, table_id=1):
+  amino_acids = codon_lookup(table_id)[0]
+  proteins = {}
+  for strand, codes in strand_codes(dna_sequence):
+    for frame in range(3):
+      proteins[strand * (frame + 1)] = amino_acids[codon_indices(codes, frame)].tobytes().decode("ascii")
+  return proteins
+
+# Function to stream the open reading frames of all six frames, one dict per ORF
+def find_orfs(dna_sequence, min_length=100, table_id=1):
+  amino_acids, is_start, is_stop = codon_lookup(table_id)
+  sequence_length = len(dna_sequence)
+  for strand, codes in strand_codes(dna_sequence):
+    for frame in range(3):
+      indices = codon_indices(codes, frame)
+      stops = np.flatnonzero(is_stop[indices])
+      starts = np.flatnonzero(is_start[indices])
+      # Pair every start with the next in-frame stop and keep only the first start before each stop
+      next_stop = np.searchsorted(stops, starts)
+      in_orf = next_stop < len(stops)
+      starts, next_stop = starts[in_orf], stops[next_stop[in_orf]]
+      next_stop, first = np.unique(next_stop, return_index=True)
+      starts = starts[first]
+      for start, stop in zip(starts.tolist(), next_stop.tolist()):
+        if stop - start < min_length:
+          continue
+        begin, end = frame + 3 * start, frame + 3 * (stop + 1)
+        if strand < 0:
+          begin, end = sequence_length - end, sequence_length - begin
+        yield {
+          "frame": strand * (frame + 1),
+          "start": begin,
+          "end": end,
+          "length": stop - start,
+          # Alternative start codons are still read as methionine when they initiate
+          "protein": "M" + amino_acids[indices[start + 1:stop]].tobytes().decode("ascii"),
+        }
+
+# Function to build a pairwise aligner with the given mode ("global" or "local") and scoring
+def build_aligner(mode="global", match_score=1.0, mismatch_score=0.0, open_gap_score=0.0, extend_gap_score=0.0):
   aligner = PairwiseAligner()
+  aligner.mode = mode
+  aligner.match_score = match_score
+  aligner.mismatch_score = mismatch_score
+  aligner.open_gap_score = open_gap_score
+  aligner.extend_gap_score = extend_gap_score
+  return aligner
+
+# Function to compare two DNA sequences, printing at most max_alignments optimal alignments
+def compare_sequences(seq1, seq2, mode="global", score_only=False, max_alignments=10, **scoring):
+  aligner = build_aligner(mode, **scoring)
+  if score_only:
+    # Scoring alone never enumerates the (possibly combinatorial) set of optimal alignments
+    score = aligner.score(seq1, seq2)
+    print(f"Alignment score: {score}")
+    return score
   alignments = aligner.align(seq1, seq2)
-  for alignment in alignments:
-  print(alignment)
+  for alignment in itertools.islice(alignments, max_alignments):
+    print(alignment)
+  return alignments.score
+
+# Sequences and aligner held by each alignment worker process
+ALIGNMENT_WORKER_STATE = None
+
+# Function to give an alignment worker its sequences and aligner once, instead of per task
+def init_alignment_worker(queries, targets, aligner_settings):
+  global ALIGNMENT_WORKER_STATE
+  ALIGNMENT_WORKER_STATE = (queries, targets, build_aligner(**aligner_settings))
+
+# Function to score one query against the targets from first_column onwards
+def score_alignment_row(task):
+  row, first_column = task
+  queries, targets, aligner = ALIGNMENT_WORKER_STATE
+  return row, first_column, [aligner.score(queries[row], target) for target in targets[first_column:]]
+
+# Function to score queries against targets (or all-vs-all) across a process pool
+def alignment_score_matrix(queries, targets=None, mode="global", workers=None, chunksize=8, **scoring):
+  queries = [str(sequence) for sequence in queries]
+  all_vs_all = targets is None
+  targets = queries if all_vs_all else [str(sequence) for sequence in targets]
+  scores = np.zeros((len(queries), len(targets)), dtype=np.float64)
+  # All-vs-all scores are symmetric, so only the upper triangle is aligned
+  tasks = [(row, row if all_vs_all else 0) for row in range(len(queries))]
+  aligner_settings = dict(scoring, mode=mode)
+  with ProcessPoolExecutor(max_workers=workers, initializer=init_alignment_worker,
+                           initargs=(queries, targets, aligner_settings)) as executor:
+    for row, first_column, row_scores in executor.map(score_alignment_row, tasks, chunksize=chunksize):
+      scores[row, first_column:] = row_scores
+  if all_vs_all:
+    scores = np.triu(scores) + np.triu(scores, 1).T
+  return scores
   
+# File name patterns picked up when a directory is given to the batch mode
+FASTA_PATTERNS = ["*.fa", "*.fasta", "*.fna", "*.fa.gz", "*.fasta.gz", "*.fna.gz"]
+
+# Function to expand directories and glob patterns into a sorted list of FASTA files
+def collect_sequence_files(paths):
+  files = set()
+  for path in paths:
+    if os.path.isdir(path):
+      for pattern in FASTA_PATTERNS:
+        files.update(glob.glob(os.path.join(path, pattern)))
+    else:
+      files.update(glob.glob(path))
+  return sorted(files)
+
+# Function to name the per-file outputs of a batch after the file's position and stem, since
+# files from different directories may share a stem and records in different files an id
+def batch_output_prefix(file_path, file_index):
+  stem = os.path.basename(file_path)
+  if stem.endswith(".gz"):
+    stem = stem[:-3]
+  stem = re.sub(r"[^A-Za-z0-9_.-]", "_", os.path.splitext(stem)[0])
+  return f"{file_index:04d}_{stem}"
+
+# Function to write the GC profile and nucleotide frequency plots of a record without a display
+def save_record_plots(record_id, dna_sequence, plot_dir, prefix=""):
+  safe_id = prefix + (re.sub(r"[^A-Za-z0-9_.-]", "_", record_id) or "record")
+  window_size = max(1, min(50, len(dna_sequence) // 2))
+  fig, ax = plt.subplots()
+  ax.plot(gc_profile(dna_sequence, window_size))
+  ax.set_title(f"GC Content over Sequence - {record_id}")
+  ax.set_xlabel("Position")
+  ax.set_ylabel("GC%")
+  fig.savefig(os.path.join(plot_dir, f"{safe_id}_gc_content.png"))
+  plt.close(fig)
+  mononucleotides = count_composition(dna_sequence, k=1)["mononucleotide"]
+  fig, ax = plt.subplots()
+  ax.bar(list(NUCLEOTIDES), [mononucleotides[base] for base in NUCLEOTIDES])
+  ax.set_title(f"Nucleotide Frequency - {record_id}")
+  ax.set_xlabel("Nucleotide")
+  ax.set_ylabel("Frequency")
+  fig.savefig(os.path.join(plot_dir, f"{safe_id}_nucleotide_frequency.png"))
+  plt.close(fig)
+
+# Function to summarise the frame +1 translation and the six-frame ORFs of a record; full protein
+# sequences of chromosome-sized records would swamp the summary table
+def translation_summary(encoded, min_orf_length=100):
+  is_stop = codon_lookup(1)[2]
+  indices = codon_indices(BASE_CODES[encoded], 0)
+  return {
+    "protein_length": len(indices),
+    "stop_codons": int(is_stop[indices].sum()),
+    "orfs": sum(1 for _ in find_orfs(encoded, min_length=min_orf_length)),
+  }
+
+# Function to analyse every record of one FASTA file, returning one summary row per record
+def analyze_sequence_file(file_path, plot_dir=None, file_index=0, protein_dir=None):
+  rows = []
+  prefix = batch_output_prefix(file_path, file_index)
+  protein_file = open(os.path.join(protein_dir, f"{prefix}.faa"), "w") if protein_dir else None
+  with open_sequence_file(file_path) as handle:
+    for record_index, record in enumerate(SeqIO.parse(io.TextIOWrapper(handle), "fasta")):
+      dna_sequence = str(record.seq).upper()
+      encoded = encode_sequence(dna_sequence)
+      composition = count_composition(encoded, k=2)
+      gc_count = int(GC_LOOKUP[encoded].sum())
+      row = {
+        "file": file_path,
+        "id": record.id,
+        "length": len(dna_sequence),
+        "gc_content": gc_count * 100.0 / len(dna_sequence) if dna_sequence else 0.0,
+      }
+      row.update(composition["mononucleotide"])
+      row.update({f"di_{kmer}": count for kmer, count in composition["dinucleotide"].items()})
+      row.update(translation_summary(encoded))
+      if protein_file:
+        protein_file.write(f">{record.id}\n{translate_six_frames(encoded)[1]}\n")
+      if plot_dir:
+        save_record_plots(record.id, dna_sequence, plot_dir, f"{prefix}_{record_index:05d}_")
+      rows.append(row)
+  if protein_file:
+    protein_file.close()
+  return rows
+
+# Function to switch worker processes to a non-interactive plotting backend
+def init_batch_worker():
+  matplotlib.use("Agg")
+
+# Function to analyse many FASTA files across a process pool and write one summary table
+def run_batch(paths, output_path, workers=None, chunksize=1, plot_dir=None, protein_dir=None):
+  files = collect_sequence_files(paths)
+  if not files:
+    raise FileNotFoundError(f"No FASTA files found for {paths}")
+  for directory in (plot_dir, protein_dir):
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+  with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker) as executor:
+    results = executor.map(analyze_sequence_file, files, itertools.repeat(plot_dir), range(len(files)),
+                           itertools.repeat(protein_dir), chunksize=chunksize)
+    summary = pd.DataFrame([row for rows in results for row in rows])
+  if output_path.endswith(".parquet"):
+    summary.to_parquet(output_path, index=False)
+  else:
+    summary.to_csv(output_path, index=False)
+  print(f"Analysed {len(summary)} records from {len(files)} files; summary written to '{output_path}'.")
+  return summary
+
+# Function to parse the batch-mode command line
+def parse_batch_args(argv=None):
+  parser = argparse.ArgumentParser(description="DNA Sequence Analyzer - batch mode")
+  parser.add_argument("paths", nargs="+", help="FASTA files, directories or glob patterns")
+  parser.add_argument("-o", "--output", default="dna_summary.csv", help="Summary file (.csv or .parquet)")
+  parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: all cores)")
+  parser.add_argument("-c", "--chunksize", type=int, default=1, help="Files handed to a worker at a time")
+  parser.add_argument("-p", "--plot-dir", default=None, help="Directory for headless PNG plots")
+  parser.add_argument("-t", "--protein-dir", default=None, help="Directory for frame +1 protein FASTA, one file per input")
+  return parser.parse_args(argv)
+
 # Main function
 def main():
   print("DNA Sequence Analyzer - Enhanced")
-# User choice for input method
-choice = input("Enter 1 to input DNA sequence manually, 2 to read from file:")
+  # User choice for input method
+  choice = input("Enter 1 to input DNA sequence manually, 2 to read from file, 3 to summarise every record in a file:")
   if choice == '1':
     dna_sequence = input_dna_sequence()
   elif choice == '2':
     file_path = input("Enter the file path: ")
     dna_sequence = read_sequence_from_file(file_path)
+  elif choice == '3':
+    file_path = input("Enter the file path: ")
+    for record in stream_sequence_records(file_path):
+      print(f"{record['id']}: {record['length']} bp, GC {record['gc_content']:.2f}%, {record['counts']}")
+    return
   else:
     print("Invalid choice")
     return
     
-if dna_sequence:
-  sequence_length = calculate_sequence_length(dna_sequence)
-  print(f"Sequence Length: {sequence_length} base pairs")
-  gc_content = calculate_gc_content(dna_sequence)
-  print(f"GC Content: {gc_content:.2f}%")
-  plot_gc_content(dna_sequence)
-  plot_nucleotide_frequency(dna_sequence)
-  plot_gc_per_position(dna_sequence)
-  protein = predict_protein(dna_sequence)
-  print(f"Predicted Protein: {protein}")
-  # Optional: Sequence comparison
-  # ...
-else:
-  print("No DNA sequence provided.")
+  if dna_sequence:
+    sequence_length = calculate_sequence_length(dna_sequence)
+    print(f"Sequence Length: {sequence_length} base pairs")
+    gc_content = calculate_gc_content(dna_sequence)
+    print(f"GC Content: {gc_content:.2f}%")
+    plot_gc_content(dna_sequence)
+    plot_nucleotide_frequency(dna_sequence)
+    plot_gc_per_position(dna_sequence)
+    protein = predict_protein(dna_sequence)
+    print(f"Predicted Protein: {protein}")
+    orfs = list(find_orfs(dna_sequence, min_length=30))
+    print(f"Open Reading Frames (>= 30 aa, six frames): {len(orfs)}")
+    # Optional: Sequence comparison
+    # ...
+  else:
+    print("No DNA sequence provided.")
   
 # Entry point of the script
 if __name__ == "__main__":
-main()
+  if len(sys.argv) > 1:
+    args = parse_batch_args()
+    run_batch(args.paths, args.output, args.workers, args.chunksize, args.plot_dir, args.protein_dir)
+  else:
+    main()
+
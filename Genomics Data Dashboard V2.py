@@ -1,20 +1,47 @@
 # Enhanced Import Section
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, Input, Output, DiskcacheManager
 from dash import dash_table
 from dash.exceptions import PreventUpdate
 
-import plotly.express as px  # For creating interactive plots
-import datetime
-import base64
+import argparse
 import io
+import os
+import diskcache
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
-# Import GenomicsData class from data_definitions module
-from data_definitions import GenomicsData
+# Import the typed loader and the shared dashboard behaviour from the data_definitions module
+from data_definitions import DatasetCache, GenomicsDataset, register_genomics_callbacks, run_production
+
+# Parsed uploads held on the server, keyed by the content hash kept in the browser
+# Spilled frames beyond GENOMICS_CACHE_MAX_BYTES on disk are dropped, least recently used first
+DATASET_CACHE = DatasetCache(
+    max_bytes=1 << 30, spill_dir=None,
+    max_spill_bytes=int(os.environ.get('GENOMICS_CACHE_MAX_BYTES', 4 << 30)),
+)
+# Background analyses and the workers of a multi-process WSGI server do not share memory
+# with the process that parsed an upload, so every upload is also stored in GENOMICS_CACHE_DIR
+DATASET_CACHE.share(os.environ.get('GENOMICS_CACHE_DIR', './cache/datasets'))
+
+# Worker threads that decode and parse the files of a multi-file upload
+UPLOAD_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Background analyses run outside the request thread; their results are cached on
+# disk keyed by the callback arguments (dataset id and analysis type) for a day
+BACKGROUND_CACHE = diskcache.Cache('./cache')
+ANALYSIS_CACHE_VERSION = '1'
+background_callback_manager = DiskcacheManager(
+    BACKGROUND_CACHE, cache_by=[lambda: ANALYSIS_CACHE_VERSION], expire=24 * 60 * 60
+)
 
 # Initialize the Dash application
-app = dash.Dash(__name__, title="Genomics Data Dashboard", suppress_callback_exceptions=True)
+app = dash.Dash(__name__, title="Genomics Data Dashboard", suppress_callback_exceptions=True,
+                background_callback_manager=background_callback_manager)
+
+# WSGI application served by run_production (--production); the file name is not importable
+# as a module, so any other WSGI runner has to load this file by path
+server = app.server
 
 # App layout with added class names for CSS
 app.layout = html.Div([
@@ -42,7 +69,8 @@ app.layout = html.Div([
                 className='analysis-selector',
                 options=[
                     {'label': 'Genomic Sequence Analysis', 'value': 'GSA'},
-                    {'label': 'Gene Expression Analysis', 'value': 'GEA'},
+                    # No Gene Expression Analysis: the typed loader keeps only gene, sequence and length,
+                    # so there are no expression values to aggregate
                     {'label': 'Variant Analysis', 'value': 'VA'},
                 ],
                 value='GSA',  # Default value
@@ -55,10 +83,31 @@ app.layout = html.Div([
             html.Button('New Analysis', id='new-analysis-button', n_clicks=0),
             html.Button('Reset', id='reset-button', n_clicks=0),
             html.Button('Download Results', id='download-button', n_clicks=0),
+            html.Button('Cancel Analysis', id='cancel-analysis-button', n_clicks=0, disabled=True),
+            dcc.Dropdown(
+                id='export-format-dropdown',
+                options=[
+                    {'label': 'CSV', 'value': 'csv'},
+                    {'label': 'Compressed CSV (.csv.gz)', 'value': 'csv.gz'},
+                    {'label': 'Parquet', 'value': 'parquet'},
+                ],
+                value='csv',
+                clearable=False,
+                style={'width': '240px', 'display': 'inline-block', 'verticalAlign': 'middle'},
+            ),
+            dcc.Store(id='download-trigger'),
         ], style={'textAlign': 'center', 'margin': '20px'}),
 
+        # Analysis progress and results
+        html.Progress(id='analysis-progress', value='0', max='1', style={'width': '100%'}),
+        html.Div(id='analysis-results'),
+        dcc.Store(id='analysis-result-id'),
+
         html.Div(id='output-data-upload'),
 
+        # Id of the server-held dataset shown in the table
+        dcc.Store(id='dataset-id'),
+
     ], className='row'),
     
     # Interactive Data Table Section
@@ -73,11 +122,13 @@ app.layout = html.Div([
             ],
             data=[],  # Placeholder data
             editable=True,  # Allow inline editing of data
-            filter_action="native",  # Allow filtering of data by user
-            sort_action="native",  # Allow sorting of data by user
+            filter_action="custom",  # Filter on the server
+            filter_query='',
+            sort_action="custom",  # Sort on the server
             sort_mode="multi",  # Allow sorting across multiple columns
+            sort_by=[],
             row_selectable="multi",  # Allow users to select multiple rows
-            page_action="native",  # All records are paginated
+            page_action="custom",  # Only the visible page is sent to the browser
             page_current=0,  # Page number that user is currently on
             page_size=10,  # Number of rows visible per page
         ),
@@ -99,107 +150,57 @@ app.layout = html.Div([
 
 ])
 
-# Callback to handle file upload and display its content
-@app.callback(
-    Output('output-data-upload', 'children'),
-    Input('upload-data', 'contents'),
-    State('upload-data', 'filename'),
-    prevent_initial_call=True  # This prevents the callback from running on startup
+# Helper functions reading uploaded files through the typed GenomicsDataset loader
+def read_csv_upload(decoded):
+    return GenomicsDataset.load(io.BytesIO(decoded)).to_frame()
+
+def read_excel_upload(decoded):
+    return GenomicsDataset.from_dataframe(pd.read_excel(io.BytesIO(decoded))).to_frame()
+
+# Upload, table, analysis and download callbacks, using the loader's lowercase column names
+register_genomics_callbacks(
+    app, DATASET_CACHE, BACKGROUND_CACHE, UPLOAD_POOL, read_csv_upload, read_excel_upload,
+    gene_column='gene', sequence_column='sequence', length_column='length', source_column='source',
+    # The other dashboards share the cache directories, so ids say which reader parsed the files
+    namespace='GenomicsDataset',
 )
-def update_output(contents, filename):
-    if contents is None:
-        # No file was uploaded, return empty Div
-        return html.Div()
-
-    try:
-        if isinstance(contents, list):
-            # Take the first item in the list (assuming only one file is uploaded)
-            content_type, content_string = contents[0].split(',')
-        else:
-            content_type, content_string = contents.split(',')
-        
-        print("Filename:", filename)
-        print("Content type:", content_type)
-        
-        decoded = base64.b64decode(content_string)
-        if 'csv' in content_type:
-            # Use GenomicsData.from_csv method to load data
-            genomics_data = GenomicsData.from_csv(io.StringIO(decoded.decode('utf-8')))
-            # Convert data to DataFrame for display
-            df = pd.DataFrame([vars(data) for data in genomics_data])
-            # Display the data table
-            table = dash_table.DataTable(
-                id='genomic-data-table',
-                columns=[{'name': i, 'id': i} for i in df.columns],
-                data=df.to_dict('records'),
-                page_size=10
-            )
-            # Generate visualization
-            if 'Gene' in df and 'Sequence' in df:
-                figure = px.bar(df, x='Gene', y='Sequence')
-                visualization = dcc.Graph(figure=figure)
-            else:
-                visualization = html.Div("Gene and/or Sequence columns not found in the uploaded CSV file.")
-            
-            return html.Div([table, visualization])
-        else:
-            return html.Div('File type not supported: please upload a CSV file.')
-    except Exception as e:
-        return html.Div(f'An error occurred while processing the file: {e}')
 
 # Callback for resetting the dashboard
 @app.callback(
     [
-        Output('genomic-data-table', 'data'),
+        Output('dataset-id', 'data', allow_duplicate=True),
         Output('analysis-type-dropdown', 'value'),
         Output('genomic-data-visualization', 'figure'),
+        Output('analysis-results', 'children', allow_duplicate=True),
+        Output('analysis-result-id', 'data', allow_duplicate=True),
         # Add Outputs here for any other components that should be reset
     ],
     [Input('reset-button', 'n_clicks')],
     # Include States here if you need to maintain the state of any component while resetting others
+    prevent_initial_call=True
 )
 def reset_dashboard(n_clicks):
-    # If the reset button has been clicked (n_clicks > 0), we reset the table data, dropdown, and figure
+    # If the reset button has been clicked (n_clicks > 0), we reset the table data, dropdown, figure and analysis
     if n_clicks and n_clicks > 0:
-        return [[], 'GSA', {}]  # Return the initial state for each component
+        return [None, 'GSA', {}, None, None]  # Return the initial state for each component
     else:
         raise PreventUpdate  # If button has not been clicked, do nothing
 
-# Helper function to parse contents
-def parse_contents(contents, filename, date):
-    content_type, content_string = contents.split(',')
-    decoded = base64.b64decode(content_string)
-    try:
-        if 'csv' in filename:
-            # Assume that the user uploaded a CSV file
-            df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
-        elif 'xls' in filename:
-            # Assume that the user uploaded an excel file
-            df = pd.read_excel(io.BytesIO(decoded))
-        else:
-            return html.Div([
-                'Unsupported file type.'
-            ])
-    except Exception as e:
-        return html.Div([
-            'There was an error processing this file.'
-        ])
-    
-    return html.Div([
-        html.H5(filename),
-        html.H6(datetime.datetime.fromtimestamp(date)),
-        html.Hr(),
-        dcc.Graph(
-            figure=px.bar(df, x=df.columns[0], y=df.columns[1])  # Example graph, modify as needed
-        ),
-        html.Hr(),
-        html.Div('Raw Content'),
-        html.Pre(contents[:200] + '...', style={
-            'whiteSpace': 'pre-wrap',
-            'wordBreak': 'break-all'
-        })
-    ])
-
 # Run the application
 if __name__ == '__main__':
-    app.run_server(debug=True)
+    parser = argparse.ArgumentParser(description="Genomics Data Dashboard")
+    parser.add_argument('--production', action='store_true', help='Serve with gunicorn instead of the debug server')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    parser.add_argument('--port', type=int, default=8050, help='Port to bind')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes in production mode')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per worker in production mode')
+    parser.add_argument('--cache-dir', default=os.environ.get('GENOMICS_CACHE_DIR', './cache/datasets'),
+                        help='Dataset directory shared by production workers')
+    args = parser.parse_args()
+
+    if args.production:
+        # Worker processes do not share memory, so uploads are persisted where every worker can load them
+        DATASET_CACHE.share(args.cache_dir)
+        run_production(server, args.host, args.port, args.workers, args.threads)
+    else:
+        app.run(debug=True, host=args.host, port=args.port)
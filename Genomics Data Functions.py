@@ -1,4 +1,37 @@
+import base64
+import bz2
+import csv
+import datetime
+import gzip
+import hashlib
+import io
+import math
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import dash
+    import flask
+    import plotly.graph_objects as go
+    from dash import Input, Output, State, dash_table, dcc, html
+except ImportError:
+    dash = None
 
 class GenomicsData:
     def __init__(self, gene: str, sequence: str, length: int):
@@ -11,21 +44,16 @@ class GenomicsData:
         """
         Loads genomics data from a CSV file.
 
+        Reads through GenomicsDataset.load, so malformed rows are skipped and
+        reported the same way; errors opening or parsing the file propagate.
+
         Args:
             filepath (str): Path to the CSV file.
 
         Returns:
             list: List of GenomicsData objects.
         """
-        try:
-            df = pd.read_csv(filepath)
-            genomics_data = []
-            for _, row in df.iterrows():
-                genomics_data.append(cls(row['Gene'], row['Sequence'], row['Length']))
-            return genomics_data
-        except Exception as e:
-            print(f"Error loading genomics data from CSV: {e}")
-            return []
+        return list(GenomicsDataset.load(filepath))
 
     def filter_by_gene(self, gene_name: str) -> list:
         """
@@ -63,3 +91,1248 @@ class GenomicsData:
         """
         gene_names = set(data.gene for data in self)
         return list(gene_names)
+
+
+class CompactGenomicsData:
+    """
+    Memory-lean genomics record.
+
+    Uses __slots__ instead of a per-instance __dict__, interns gene names and
+    stores the sequence as bytes: packed four bases per byte when it is plain
+    uppercase ACGT, raw ASCII otherwise. The sequence is decoded on access.
+    """
+
+    __slots__ = ('gene', 'length', 'encoded_sequence', 'packed_length')
+
+    BASES = np.frombuffer(b'ACGT', dtype=np.uint8)
+    BASE_CODES = np.full(256, 255, dtype=np.uint8)
+    BASE_CODES[BASES] = np.arange(4, dtype=np.uint8)
+    SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+    def __init__(self, gene: str, sequence: str, length: int):
+        self.gene = sys.intern(str(gene))
+        self.length = int(length)
+        raw = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+        codes = self.BASE_CODES[raw]
+        if codes.size and (codes != 255).all():
+            padded = np.zeros(-(-codes.size // 4) * 4, dtype=np.uint8)
+            padded[:codes.size] = codes
+            packed = (padded.reshape(-1, 4) << self.SHIFTS).sum(axis=1, dtype=np.uint8)
+            self.encoded_sequence = packed.tobytes()
+            self.packed_length = codes.size
+        else:
+            self.encoded_sequence = raw.tobytes()
+            self.packed_length = None
+
+    @property
+    def sequence(self) -> str:
+        if self.packed_length is None:
+            return self.encoded_sequence.decode('ascii')
+        packed = np.frombuffer(self.encoded_sequence, dtype=np.uint8)
+        codes = (packed[:, None] >> self.SHIFTS) & 3
+        return self.BASES[codes.ravel()[:self.packed_length]].tobytes().decode('ascii')
+
+
+class GenomicsIndex:
+    """
+    Lazily built lookup structures over a genomics frame.
+
+    The gene index maps each gene name to the sorted row positions of that
+    gene. The length index keeps row positions ordered by sequence length so
+    that range queries are two binary searches. Both are built on first use.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.gene_index = None
+        self.length_order = None
+        self.sorted_lengths = None
+
+    def rows_for_gene(self, gene_name: str) -> np.ndarray:
+        """
+        Looks up the row positions of a gene.
+
+        Args:
+            gene_name (str): Name of the gene.
+
+        Returns:
+            np.ndarray: Sorted row positions of the gene (empty if unknown).
+        """
+        if self.gene_index is None:
+            genes = self.frame['gene'].cat
+            codes = genes.codes.to_numpy()
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(genes.categories) + 1))
+            self.gene_index = {
+                gene: order[bounds[code]:bounds[code + 1]]
+                for code, gene in enumerate(genes.categories)
+            }
+        return self.gene_index.get(gene_name, np.empty(0, dtype=np.intp))
+
+    def rows_for_length_range(self, min_length: int, max_length: int) -> np.ndarray:
+        """
+        Looks up the row positions whose sequence length lies in a range.
+
+        Args:
+            min_length (int): Minimum length of the sequence.
+            max_length (int): Maximum length of the sequence.
+
+        Returns:
+            np.ndarray: Sorted row positions within the length range.
+        """
+        if self.length_order is None:
+            lengths = self.frame['length'].to_numpy()
+            self.length_order = np.argsort(lengths, kind='stable')
+            self.sorted_lengths = lengths[self.length_order]
+        start = np.searchsorted(self.sorted_lengths, min_length, side='left')
+        stop = np.searchsorted(self.sorted_lengths, max_length, side='right')
+        return np.sort(self.length_order[start:stop])
+
+
+class GenomicsDataset:
+    """
+    Column-oriented collection of genomics records.
+
+    Records are held once in a DataFrame with a categorical gene column.
+    A dataset is a view over that frame: filters return a new dataset that
+    shares the same frame and index and only carries the selected row positions.
+    """
+
+    COLUMNS = {'Gene': 'gene', 'Sequence': 'sequence', 'Length': 'length'}
+
+    def __init__(self, frame: pd.DataFrame, positions: np.ndarray = None, index: GenomicsIndex = None):
+        self.frame = frame
+        self.positions = np.arange(len(frame)) if positions is None else positions
+        self.index = GenomicsIndex(frame) if index is None else index
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'GenomicsDataset':
+        """
+        Builds a dataset from a DataFrame with Gene, Sequence and Length columns.
+
+        Args:
+            df (pd.DataFrame): Source data.
+
+        Returns:
+            GenomicsDataset: Dataset over all rows of the data.
+        """
+        return cls(cls.normalize_frame(df))
+
+    @classmethod
+    def normalize_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Selects and renames the Gene, Sequence and Length columns of raw data.
+
+        Args:
+            df (pd.DataFrame): Source data.
+
+        Returns:
+            pd.DataFrame: Frame with a categorical gene column and int32 lengths.
+        """
+        frame = df[list(cls.COLUMNS)].rename(columns=cls.COLUMNS)
+        frame = frame.astype({'gene': 'category', 'length': 'int32'})
+        return frame.reset_index(drop=True)
+
+    @classmethod
+    def from_csv(cls, filepath: str) -> 'GenomicsDataset':
+        """
+        Loads genomics data from a CSV file into a columnar dataset.
+
+        Args:
+            filepath (str): Path to the CSV file.
+
+        Returns:
+            GenomicsDataset: Dataset over all rows of the file.
+        """
+        return cls.load(filepath)
+
+    @classmethod
+    def load(cls, filepath, chunksize: int = 1_000_000) -> 'GenomicsDataset':
+        """
+        Loads genomics data from CSV, Parquet or Feather in typed chunks.
+
+        Only the Gene, Sequence and Length columns are read. CSV input is
+        streamed with pyarrow when it is installed and with the csv module
+        otherwise; both apply the same rules. Malformed rows (wrong field
+        count, empty Gene or Sequence, missing or non-integer Length) are
+        skipped and reported with their line number, and are kept on the
+        returned dataset as malformed_rows.
+
+        Args:
+            filepath (str | file-like): Path or open handle of the input.
+            chunksize (int): Number of rows per chunk.
+
+        Returns:
+            GenomicsDataset: Dataset over all valid rows.
+        """
+        skipped = []
+        invalid_rows = []
+        if isinstance(filepath, str) and filepath.endswith(('.parquet', '.pq')):
+            chunks = cls.read_parquet_chunks(filepath, chunksize)
+            first_line = 1
+        elif isinstance(filepath, str) and filepath.endswith(('.feather', '.arrow')):
+            chunks = [pd.read_feather(filepath, columns=list(cls.COLUMNS))]
+            first_line = 1
+        elif pa is not None and isinstance(filepath, (str, io.BufferedIOBase)):
+            chunks = cls.read_csv_chunks_arrow(filepath, chunksize, skipped)
+            first_line = 2
+        else:
+            chunks = cls.read_csv_chunks_python(filepath, chunksize, skipped)
+            first_line = 2
+
+        frames = []
+        rows_seen = 0
+        for chunk in chunks:
+            lengths = pd.to_numeric(chunk['Length'], errors='coerce')
+            invalid = lengths.isna() | (lengths % 1 != 0) | chunk['Gene'].isna() | chunk['Sequence'].isna()
+            for ordinal in np.flatnonzero(invalid.to_numpy()):
+                line = cls.source_line(rows_seen + ordinal, first_line, skipped)
+                invalid_rows.append((int(line), f"invalid values {chunk.iloc[ordinal].tolist()}"))
+            rows_seen += len(chunk)
+            chunk = chunk[~invalid].assign(Length=lengths[~invalid])
+            frames.append(cls.normalize_frame(chunk))
+
+        malformed = sorted(skipped + invalid_rows)
+        for line, reason in malformed:
+            print(f"Skipped malformed row at line {line}: {reason}")
+        if not frames:
+            frames = [cls.normalize_frame(pd.DataFrame(columns=list(cls.COLUMNS)))]
+        frame = pd.DataFrame({
+            'gene': union_categoricals([f['gene'] for f in frames]),
+            'sequence': np.concatenate([f['sequence'].to_numpy(dtype=object) for f in frames]),
+            'length': np.concatenate([f['length'].to_numpy() for f in frames]),
+        })
+        dataset = cls(frame)
+        dataset.malformed_rows = malformed
+        return dataset
+
+    @staticmethod
+    def source_line(ordinal: int, first_line: int, skipped: list) -> int:
+        # Maps the ordinal of a parsed row to its file line, stepping over lines the parser skipped
+        line = first_line + ordinal
+        for skipped_line, _ in sorted(skipped):
+            if skipped_line > line:
+                break
+            line += 1
+        return line
+
+    @classmethod
+    def read_csv_chunks_arrow(cls, filepath, chunksize: int, malformed: list):
+        """
+        Streams the required CSV columns with the multithreaded pyarrow reader.
+
+        Args:
+            filepath (str | file-like): Path or binary handle of the CSV.
+            chunksize (int): Approximate number of rows per chunk.
+            malformed (list): Receives (line, reason) for unparsable rows.
+
+        Yields:
+            pd.DataFrame: Chunk with a categorical Gene column.
+        """
+        def skip_invalid_row(row):
+            malformed.append((row.number, f"Expected {row.expected_columns} columns, got {row.actual_columns}"))
+            return 'skip'
+
+        reader = pa_csv.open_csv(
+            filepath,
+            # Roughly 64 bytes per row is enough to keep block reads near chunksize rows
+            read_options=pa_csv.ReadOptions(block_size=max(1 << 20, chunksize * 64)),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=skip_invalid_row),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=list(cls.COLUMNS),
+                # Only empty fields are null, so 'NA' or 'null' stay valid gene names
+                null_values=[''],
+                strings_can_be_null=True,
+                column_types={
+                    'Gene': pa.dictionary(pa.int32(), pa.string()),
+                    'Sequence': pa.string(),
+                    'Length': pa.string(),
+                },
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+
+    @classmethod
+    def read_csv_chunks_python(cls, filepath, chunksize: int, malformed: list):
+        """
+        Streams the required CSV columns with the standard csv module.
+
+        Applies the same rules as the pyarrow reader: a record whose field
+        count differs from the header is malformed, and empty fields are null.
+
+        Args:
+            filepath (str | file-like): Path or handle of the CSV.
+            chunksize (int): Number of rows per chunk.
+            malformed (list): Receives (line, reason) for unparsable rows.
+
+        Yields:
+            pd.DataFrame: Chunk with a categorical Gene column.
+        """
+        if isinstance(filepath, str):
+            opener = {'.gz': gzip.open, '.bz2': bz2.open}.get(os.path.splitext(filepath)[1], open)
+            handle = opener(filepath, 'rt', newline='', encoding='utf-8')
+        elif isinstance(filepath, io.TextIOBase):
+            handle = filepath
+        else:
+            handle = io.TextIOWrapper(filepath, newline='', encoding='utf-8')
+
+        try:
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            missing = [column for column in cls.COLUMNS if column not in header]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}")
+            picks = [header.index(column) for column in cls.COLUMNS]
+            rows = []
+            for record in reader:
+                if not record:
+                    continue
+                if len(record) != len(header):
+                    malformed.append((reader.line_num, f"Expected {len(header)} columns, got {len(record)}"))
+                    continue
+                rows.append([record[pick] or None for pick in picks])
+                if len(rows) == chunksize:
+                    yield cls.csv_chunk_frame(rows)
+                    rows = []
+            if rows:
+                yield cls.csv_chunk_frame(rows)
+        finally:
+            if isinstance(filepath, str):
+                handle.close()
+            elif handle is not filepath:
+                # Unwrap without closing the caller's binary handle
+                handle.detach()
+
+    @classmethod
+    def csv_chunk_frame(cls, rows: list) -> pd.DataFrame:
+        # Same column types as the pyarrow reader produces
+        frame = pd.DataFrame(rows, columns=list(cls.COLUMNS), dtype=object)
+        return frame.astype({'Gene': 'category'})
+
+    @classmethod
+    def read_parquet_chunks(cls, filepath: str, chunksize: int):
+        """
+        Streams the required Parquet columns in record batches.
+
+        Args:
+            filepath (str): Path of the Parquet file.
+            chunksize (int): Number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Chunk of the Gene, Sequence and Length columns.
+        """
+        if pa is None:
+            yield pd.read_parquet(filepath, columns=list(cls.COLUMNS))
+            return
+        for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunksize, columns=list(cls.COLUMNS)):
+            yield batch.to_pandas()
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def is_full(self) -> bool:
+        # Positions are always a sorted subset of the frame rows
+        return len(self.positions) == len(self.frame)
+
+    def select(self, rows: np.ndarray) -> 'GenomicsDataset':
+        # Restricts sorted frame row positions to this view
+        if not self.is_full():
+            rows = rows[np.isin(rows, self.positions, assume_unique=True)]
+        return GenomicsDataset(self.frame, rows, self.index)
+
+    def add_records(self, df: pd.DataFrame) -> None:
+        """
+        Appends records to the dataset and invalidates its indexes.
+
+        Args:
+            df (pd.DataFrame): New data with Gene, Sequence and Length columns.
+        """
+        new = self.normalize_frame(df)
+        genes = union_categoricals([self.frame['gene'], new['gene']])
+        frame = pd.DataFrame({
+            'gene': genes,
+            'sequence': np.concatenate([self.frame['sequence'].to_numpy(), new['sequence'].to_numpy()]),
+            'length': np.concatenate([self.frame['length'].to_numpy(), new['length'].to_numpy()]),
+        })
+        self.positions = np.concatenate([self.positions, np.arange(len(self.frame), len(frame))])
+        self.frame = frame
+        # Views taken before the append keep the old frame and its still-valid index
+        self.index = GenomicsIndex(frame)
+
+    def __iter__(self):
+        genes = self.frame['gene'].to_numpy()
+        sequences = self.frame['sequence'].to_numpy()
+        lengths = self.frame['length'].to_numpy()
+        for position in self.positions:
+            yield GenomicsData(genes[position], sequences[position], int(lengths[position]))
+
+    def filter_by_gene(self, gene_name: str) -> 'GenomicsDataset':
+        """
+        Filters genomics data by gene name.
+
+        Args:
+            gene_name (str): Name of the gene to filter by.
+
+        Returns:
+            GenomicsDataset: View over the rows of the given gene.
+        """
+        return self.select(self.index.rows_for_gene(gene_name))
+
+    def filter_by_sequence_length(self, min_length: int, max_length: int) -> 'GenomicsDataset':
+        """
+        Filters genomics data by sequence length.
+
+        Args:
+            min_length (int): Minimum length of the sequence.
+            max_length (int): Maximum length of the sequence.
+
+        Returns:
+            GenomicsDataset: View over the rows within the length range.
+        """
+        return self.select(self.index.rows_for_length_range(min_length, max_length))
+
+    def get_gene_names(self) -> list:
+        """
+        Retrieves a list of unique gene names from the genomics data.
+
+        Returns:
+            list: List of unique gene names.
+        """
+        genes = self.frame['gene'].cat
+        codes = np.unique(genes.codes.to_numpy()[self.positions])
+        return genes.categories[codes[codes >= 0]].tolist()
+
+    def compact_records(self) -> list:
+        """
+        Builds compact record objects for object-style access to the selected rows.
+
+        Returns:
+            list: List of CompactGenomicsData objects.
+        """
+        genes = self.frame['gene'].to_numpy()
+        sequences = self.frame['sequence'].to_numpy()
+        lengths = self.frame['length'].to_numpy()
+        return [CompactGenomicsData(genes[position], sequences[position], lengths[position])
+                for position in self.positions]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Materializes the selected rows as a DataFrame.
+
+        Returns:
+            pd.DataFrame: Copy of the selected rows with gene, sequence and length columns.
+        """
+        return self.frame.iloc[self.positions].reset_index(drop=True)
+
+
+class DatasetCache:
+    """
+    Bounded, thread-safe LRU cache of parsed DataFrames keyed by content hash.
+
+    Entries are evicted least-recently-used first once their combined memory
+    footprint exceeds max_bytes. When spill_dir is set, evicted frames are
+    written there as Parquet and read back on the next lookup. With
+    write_through, every stored frame is written to spill_dir immediately,
+    so several server processes sharing the directory see each other's data.
+    With max_spill_bytes, the least recently used files in spill_dir are
+    deleted once the directory grows past that size.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 30, spill_dir: str = None, write_through: bool = False,
+                 max_spill_bytes: int = None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.write_through = write_through and bool(spill_dir)
+        self.max_spill_bytes = max_spill_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    @staticmethod
+    def content_id(data: bytes, namespace: str = '') -> str:
+        """
+        Computes the dataset id of raw uploaded bytes.
+
+        Args:
+            data (bytes): Decoded file content.
+            namespace (str): Name of the reader that parses the content; the same bytes parsed
+                by different readers give different frames, so they get different ids.
+
+        Returns:
+            str: Hex digest identifying the content.
+        """
+        return hashlib.blake2b(namespace.encode() + b'\0' + data, digest_size=16).hexdigest()
+
+    def __getstate__(self) -> dict:
+        # Background jobs may run in a spawned process: they get the configuration and find
+        # shared frames on disk, while the in-memory entries and the lock stay behind
+        return {
+            'max_bytes': self.max_bytes, 'spill_dir': self.spill_dir, 'write_through': self.write_through,
+            'max_spill_bytes': self.max_spill_bytes,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['max_bytes'], state['spill_dir'], state['write_through'], state['max_spill_bytes'])
+
+    def share(self, spill_dir: str) -> None:
+        """
+        Switches the cache to write-through storage in a directory shared by several processes.
+
+        Frames already held in memory are written there too.
+
+        Args:
+            spill_dir (str): Directory every server process can read and write.
+        """
+        os.makedirs(spill_dir, exist_ok=True)
+        with self.lock:
+            self.spill_dir = spill_dir
+            self.write_through = True
+            entries = [(dataset_id, df) for dataset_id, (df, _) in self.entries.items()]
+        for dataset_id, df in entries:
+            self.spill(dataset_id, df)
+
+    @staticmethod
+    def is_valid_id(dataset_id) -> bool:
+        # Ids arrive from the browser, so only the exact content_id shape may reach a file path
+        return isinstance(dataset_id, str) and re.fullmatch(r'[0-9a-f]{32}', dataset_id) is not None
+
+    def spill_path(self, dataset_id: str) -> str:
+        if not self.is_valid_id(dataset_id):
+            raise ValueError(f"Invalid dataset id: {dataset_id!r}")
+        return os.path.join(self.spill_dir, f"{dataset_id}.parquet")
+
+    def spill(self, dataset_id: str, df: pd.DataFrame) -> None:
+        path = self.spill_path(dataset_id)
+        if not os.path.exists(path):
+            # Write under a private name first so other processes never read a partial file
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            df.to_parquet(temp_path, index=False)
+            os.replace(temp_path, path)
+            self.prune_spill(keep=path)
+
+    def prune_spill(self, keep: str = None) -> None:
+        """
+        Deletes the least recently used spilled frames until the directory fits max_spill_bytes.
+
+        Args:
+            keep (str): Path of a file that must survive, usually the one just written.
+        """
+        if not self.max_spill_bytes:
+            return
+        files = []
+        for entry in os.scandir(self.spill_dir):
+            if entry.name.endswith('.parquet'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Pruned by another process meanwhile
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_spill_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def touch(self, dataset_id: str) -> None:
+        # Reads refresh the file's mtime, which is what prune_spill orders by
+        try:
+            os.utime(self.spill_path(dataset_id))
+        except FileNotFoundError:
+            pass
+
+    def get(self, dataset_id: str) -> pd.DataFrame:
+        """
+        Looks up a dataset, reloading it from the spill directory if it was evicted.
+
+        Args:
+            dataset_id (str): Id returned by content_id.
+
+        Returns:
+            pd.DataFrame: The cached data, or None if it is unknown or not a valid id.
+        """
+        if not self.is_valid_id(dataset_id):
+            return None
+        with self.lock:
+            if dataset_id in self.entries:
+                self.entries.move_to_end(dataset_id)
+                df = self.entries[dataset_id][0]
+            else:
+                df = None
+        if df is not None:
+            if self.write_through and self.max_spill_bytes:
+                self.touch(dataset_id)
+            return df
+        if self.spill_dir and os.path.exists(self.spill_path(dataset_id)):
+            try:
+                df = pd.read_parquet(self.spill_path(dataset_id))
+            except FileNotFoundError:
+                return None  # Pruned between the check and the read
+            self.touch(dataset_id)
+            self.put(dataset_id, df)
+            return df
+        return None
+
+    def put(self, dataset_id: str, df: pd.DataFrame) -> None:
+        """
+        Stores a dataset and evicts older entries beyond the size limit.
+
+        Args:
+            dataset_id (str): Id returned by content_id.
+            df (pd.DataFrame): Parsed data.
+
+        Raises:
+            ValueError: If dataset_id is not an id returned by content_id.
+        """
+        if not self.is_valid_id(dataset_id):
+            raise ValueError(f"Invalid dataset id: {dataset_id!r}")
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self.lock:
+            if dataset_id in self.entries:
+                self.total_bytes -= self.entries.pop(dataset_id)[1]
+            self.entries[dataset_id] = (df, nbytes)
+            self.total_bytes += nbytes
+            evicted = []
+            # The newest entry is always kept, even if it alone exceeds the limit
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_id, (old_df, old_bytes) = self.entries.popitem(last=False)
+                self.total_bytes -= old_bytes
+                evicted.append((old_id, old_df))
+        if self.write_through:
+            self.spill(dataset_id, df)
+        elif self.spill_dir:
+            for old_id, old_df in evicted:
+                self.spill(old_id, old_df)
+
+    def __contains__(self, dataset_id: str) -> bool:
+        if not self.is_valid_id(dataset_id):
+            return False
+        with self.lock:
+            if dataset_id in self.entries:
+                return True
+        return bool(self.spill_dir) and os.path.exists(self.spill_path(dataset_id))
+
+
+def downsample_minmax(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple:
+    """
+    Decimates a series to at most max_points by keeping each bucket's extremes.
+
+    The series is split into max_points // 2 equal buckets and the minimum
+    and maximum of every bucket are kept in their original order, so peaks
+    and dips survive the reduction.
+
+    Args:
+        x (np.ndarray): X values, in plotting order.
+        y (np.ndarray): Y values matching x.
+        max_points (int): Largest number of points to return.
+
+    Returns:
+        tuple: Downsampled (x, y) arrays.
+    """
+    if len(y) <= max_points:
+        return x, y
+    buckets = max(1, max_points // 2)
+    bucket_ids = np.arange(len(y)) * buckets // len(y)
+    order = np.lexsort((y, bucket_ids))
+    bucket_starts = np.searchsorted(bucket_ids[order], np.arange(buckets))
+    bucket_ends = np.append(bucket_starts[1:], len(y)) - 1
+    keep = np.unique(np.concatenate([order[bucket_starts], order[bucket_ends]]))
+    return x[keep], y[keep]
+
+
+def analyze_genomics_frame(df: pd.DataFrame, analysis_type: str, gene_column: str = 'gene',
+                           sequence_column: str = 'sequence', length_column: str = 'length',
+                           chunksize: int = 100_000, on_progress=None) -> pd.DataFrame:
+    """
+    Runs a per-gene analysis over a genomics frame in chunks.
+
+    'GSA' (sequence analysis) reports record count, mean length and GC%.
+    'GEA' (expression analysis) reports the mean of every other numeric
+    column. 'VA' (variant analysis) reports the number of distinct sequences
+    and the share of the most common one.
+
+    Args:
+        df (pd.DataFrame): Genomics data.
+        analysis_type (str): One of 'GSA', 'GEA' or 'VA'.
+        gene_column (str): Name of the gene column.
+        sequence_column (str): Name of the sequence column.
+        length_column (str): Name of the length column.
+        chunksize (int): Number of rows aggregated at a time.
+        on_progress (callable): Called with (rows_done, rows_total) after each chunk.
+
+    Returns:
+        pd.DataFrame: One row per gene.
+    """
+    if analysis_type not in ('GSA', 'GEA', 'VA'):
+        raise ValueError(f"Unknown analysis type: {analysis_type}")
+    value_columns = [
+        column for column in df.select_dtypes('number').columns
+        if column not in (length_column, gene_column)
+    ]
+    partials = []
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        genes = chunk[gene_column].astype(str)
+        sequences = chunk[sequence_column].astype(str)
+        if analysis_type == 'GSA':
+            upper = sequences.str.upper()
+            partial = pd.DataFrame({
+                'gene': genes,
+                'records': 1,
+                'total_length': sequences.str.len(),
+                'gc_bases': upper.str.count('G') + upper.str.count('C'),
+            }).groupby('gene').sum()
+        elif analysis_type == 'GEA':
+            partial = chunk[value_columns].assign(gene=genes, records=1).groupby('gene').sum()
+        else:
+            partial = pd.DataFrame({'gene': genes, 'sequence': sequences}).value_counts().rename('records')
+        partials.append(partial)
+        if on_progress is not None:
+            on_progress(min(start + chunksize, len(df)), len(df))
+
+    if not partials:
+        return pd.DataFrame(columns=['gene', 'records'])
+    totals = pd.concat(partials).groupby(level=list(range(partials[0].index.nlevels))).sum()
+    if analysis_type == 'GSA':
+        result = pd.DataFrame({
+            'records': totals['records'],
+            'mean_length': totals['total_length'] / totals['records'],
+            'gc_content': 100.0 * totals['gc_bases'] / totals['total_length'].where(totals['total_length'] > 0),
+        })
+    elif analysis_type == 'GEA':
+        result = totals[value_columns].div(totals['records'], axis=0).add_prefix('mean_')
+        result.insert(0, 'records', totals['records'])
+    else:
+        per_gene = totals.groupby(level='gene')
+        result = pd.DataFrame({
+            'records': per_gene.sum(),
+            'distinct_sequences': per_gene.size(),
+            'dominant_fraction': per_gene.max() / per_gene.sum(),
+        })
+    return result.reset_index()
+
+
+# File extension and MIME type of each export format
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'csv.gz': ('csv.gz', 'application/gzip'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+
+class ChunkSink:
+    """
+    Write-only file object that hands back what was written since the last drain.
+
+    Writers that track their own offsets (such as the Parquet writer) only
+    need write() and tell(), so the output can be passed on piece by piece
+    instead of accumulating in one buffer.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def iter_export_chunks(df: pd.DataFrame, export_format: str = 'csv', chunksize: int = 100_000):
+    """
+    Serializes a DataFrame chunk by chunk for a streaming download.
+
+    Args:
+        df (pd.DataFrame): Data to export.
+        export_format (str): 'csv', 'csv.gz' or 'parquet'.
+        chunksize (int): Number of rows serialized at a time.
+
+    Yields:
+        bytes: Consecutive pieces of the exported file.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    if export_format == 'parquet':
+        if pa is None:
+            raise ValueError("Parquet export requires pyarrow")
+        sink = ChunkSink()
+        schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+        with pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema) as writer:
+            for start in range(0, len(df), chunksize):
+                chunk = df.iloc[start:start + chunksize]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                yield sink.drain()
+        yield sink.drain()
+        return
+
+    # wbits=31 makes zlib write a gzip header and trailer
+    compressor = zlib.compressobj(wbits=31) if export_format == 'csv.gz' else None
+    for start in range(0, max(len(df), 1), chunksize):
+        buffer = io.StringIO()
+        df.iloc[start:start + chunksize].to_csv(buffer, header=start == 0, index=False)
+        data = buffer.getvalue().encode('utf-8')
+        yield compressor.compress(data) if compressor else data
+    if compressor:
+        yield compressor.flush()
+
+
+# Figures never draw more marks than this; longer series are decimated
+MAX_PLOT_POINTS = 5000
+# Number of genes shown in the gene count chart
+TOP_N_GENES = 20
+# Largest number of per-gene result rows shown on the page
+RESULT_PREVIEW_ROWS = 1000
+# Cache lifetime in seconds for static assets served in production
+ASSET_MAX_AGE = 24 * 60 * 60
+
+# Filter operators understood by the DataTable filter_query syntax
+FILTER_OPERATORS = [
+    ['ge ', '>='],
+    ['le ', '<='],
+    ['lt ', '<'],
+    ['gt ', '>'],
+    ['ne ', '!='],
+    ['eq ', '='],
+    ['contains '],
+    ['datestartswith '],
+]
+
+
+def split_filter_part(filter_part: str) -> tuple:
+    """
+    Splits one "{column} op value" part of a DataTable filter_query.
+
+    Args:
+        filter_part (str): One part of the query, between ' && ' separators.
+
+    Returns:
+        tuple: (column, operator, value), or (None, None, None) if no operator matched.
+    """
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find('{') + 1: name_part.rfind('}')]
+                value_part = value_part.strip()
+                v0 = value_part[0] if value_part else ''
+                if v0 == value_part[-1:] and v0 in ("'", '"', '`'):
+                    value = value_part[1: -1].replace('\\' + v0, v0)
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                # word operators need spaces after them in the filter string,
+                # but we don't want these later
+                return name, operator_type[0].strip(), value
+    return (None, None, None)
+
+
+def filter_dataframe(df: pd.DataFrame, filter_query: str) -> pd.DataFrame:
+    """
+    Applies a DataTable filter_query to a DataFrame.
+
+    Args:
+        df (pd.DataFrame): Data to filter.
+        filter_query (str): Query in the DataTable filter syntax.
+
+    Returns:
+        pd.DataFrame: Rows matching every part of the query.
+    """
+    for filter_part in (filter_query or '').split(' && '):
+        col_name, operator, filter_value = split_filter_part(filter_part)
+        if col_name not in df:
+            continue
+        if operator in ('eq', 'ne', 'lt', 'le', 'gt', 'ge'):
+            df = df.loc[getattr(df[col_name], operator)(filter_value)]
+        elif operator == 'contains':
+            df = df.loc[df[col_name].astype(str).str.contains(str(filter_value), regex=False)]
+        elif operator == 'datestartswith':
+            df = df.loc[df[col_name].astype(str).str.startswith(str(filter_value))]
+    return df
+
+
+def page_dataframe(df: pd.DataFrame, page_current: int, page_size: int, sort_by: list,
+                   filter_query: str) -> tuple:
+    """
+    Filters and sorts a DataFrame and cuts out one DataTable page.
+
+    Args:
+        df (pd.DataFrame): Full dataset.
+        page_current (int): Zero-based page number.
+        page_size (int): Rows per page.
+        sort_by (list): DataTable sort_by entries.
+        filter_query (str): Query in the DataTable filter syntax.
+
+    Returns:
+        tuple: (records of the page, number of pages).
+    """
+    df = filter_dataframe(df, filter_query)
+    if sort_by:
+        df = df.sort_values(
+            [col['column_id'] for col in sort_by],
+            ascending=[col['direction'] == 'asc' for col in sort_by],
+        )
+    start = (page_current or 0) * page_size
+    page = df.iloc[start:start + page_size]
+    return page.to_dict('records'), max(1, math.ceil(len(df) / page_size))
+
+
+def build_figures(df: pd.DataFrame, gene_column: str = 'gene', sequence_column: str = 'sequence',
+                  length_column: str = 'length') -> list:
+    """
+    Builds aggregated figures whose size does not grow with the data.
+
+    Args:
+        df (pd.DataFrame): Genomics data.
+        gene_column (str): Name of the gene column.
+        sequence_column (str): Name of the sequence column.
+        length_column (str): Name of the length column; sequence lengths are used if it is missing.
+
+    Returns:
+        list: Top genes bar chart, length histogram and decimated length series.
+    """
+    if length_column in df:
+        lengths = df[length_column].to_numpy()
+    else:
+        lengths = df[sequence_column].str.len().to_numpy()
+
+    gene_counts = df[gene_column].value_counts().head(TOP_N_GENES)
+    gene_figure = go.Figure(go.Bar(x=gene_counts.index.astype(str), y=gene_counts.to_numpy()))
+    gene_figure.update_layout(title=f'Top {TOP_N_GENES} Genes by Record Count', xaxis_title='Gene', yaxis_title='Records')
+
+    counts, edges = np.histogram(lengths, bins=min(50, max(1, len(lengths))))
+    length_figure = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    length_figure.update_layout(title='Sequence Length Distribution', xaxis_title='Length', yaxis_title='Records')
+
+    x, y = downsample_minmax(np.arange(len(lengths)), lengths, MAX_PLOT_POINTS)
+    series_figure = go.Figure(go.Scattergl(x=x, y=y, mode='lines+markers' if len(lengths) <= MAX_PLOT_POINTS else 'lines'))
+    series_figure.update_layout(title='Sequence Length by Record', xaxis_title='Record', yaxis_title='Length')
+
+    return [gene_figure, length_figure, series_figure]
+
+
+def parse_upload(contents: str, filename: str, date, cache: DatasetCache, read_csv, read_excel,
+                 namespace: str = '') -> dict:
+    """
+    Decodes and parses one uploaded file, reusing the cached frame of identical content.
+
+    Args:
+        contents (str): Base64 data URL from dcc.Upload.
+        filename (str): Name of the uploaded file.
+        date (float): Last-modified timestamp, or None.
+        cache (DatasetCache): Cache of parsed uploads.
+        read_csv (callable): Turns the bytes of a CSV file into a DataFrame.
+        read_excel (callable): Turns the bytes of an Excel file into a DataFrame.
+        namespace (str): Name of the readers, mixed into the dataset id.
+
+    Returns:
+        dict: filename, date, dataset_id, data, error and seconds of the parse.
+    """
+    started = time.perf_counter()
+    result = {'filename': filename, 'date': date, 'dataset_id': None, 'data': None, 'error': None}
+    try:
+        if 'csv' not in filename and 'xls' not in filename:
+            raise ValueError('Unsupported file type.')
+        content_type, content_string = contents.split(',')
+        decoded = base64.b64decode(content_string)
+        result['dataset_id'] = DatasetCache.content_id(decoded, namespace)
+        # Re-uploads of a file already seen skip parsing entirely
+        df = cache.get(result['dataset_id'])
+        if df is None:
+            df = read_csv(decoded) if 'csv' in filename else read_excel(decoded)
+            cache.put(result['dataset_id'], df)
+        result['data'] = df
+    except Exception as e:
+        result['error'] = f'There was an error processing this file: {e}'
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def render_upload_report(results: list):
+    """
+    Summarises the outcome and parse time of each uploaded file.
+
+    Args:
+        results (list): Results returned by parse_upload.
+
+    Returns:
+        html.Ul: One list item per file.
+    """
+    items = []
+    for result in results:
+        label = result['filename']
+        if result['date'] is not None:
+            label += f" ({datetime.datetime.fromtimestamp(result['date'])})"
+        if result['error'] is None:
+            items.append(html.Li(f"{label}: {len(result['data'])} rows parsed in {result['seconds'] * 1000:.0f} ms"))
+        else:
+            items.append(html.Li(f"{label}: failed after {result['seconds'] * 1000:.0f} ms - {result['error']}"))
+    return html.Ul(items)
+
+
+def render_analysis_result(result: pd.DataFrame, analysis_type: str):
+    """
+    Shows the largest genes of an analysis result as a table.
+
+    Args:
+        result (pd.DataFrame): Output of analyze_genomics_frame.
+        analysis_type (str): Analysis that produced the result.
+
+    Returns:
+        html.Div: Heading and table of at most RESULT_PREVIEW_ROWS genes.
+    """
+    preview = result.sort_values('records', ascending=False).head(RESULT_PREVIEW_ROWS)
+    return html.Div([
+        html.H5(f'{analysis_type} results: {len(result)} genes'),
+        dash_table.DataTable(
+            columns=[{'name': i, 'id': i} for i in preview.columns],
+            data=preview.to_dict('records'),
+            sort_action='native',
+            page_size=10,
+        ),
+    ])
+
+
+# Clientside callback pointing the browser at the download route: the latest analysis result
+# if there is one, otherwise the uploaded dataset
+DOWNLOAD_CLIENTSIDE_CALLBACK = """
+function(n_clicks, resultId, datasetId, exportFormat) {
+    var source = resultId ? 'analysis/' + resultId : (datasetId ? 'dataset/' + datasetId : null);
+    if (!n_clicks || !source) {
+        return window.dash_clientside.no_update;
+    }
+    window.location.assign('/download/' + source + '?format=' + encodeURIComponent(exportFormat));
+    return n_clicks;
+}
+"""
+
+
+def register_genomics_callbacks(app, dataset_cache: DatasetCache, result_cache, upload_pool, read_csv, read_excel,
+                                gene_column: str = 'gene', sequence_column: str = 'sequence',
+                                length_column: str = 'length', source_column: str = 'source',
+                                namespace: str = '') -> None:
+    """
+    Wires the upload, table, analysis and download behaviour shared by the genomics dashboards.
+
+    The app layout must contain the upload-data, dataset-id, genomic-data-table,
+    output-data-upload, analysis-* and download-* components, and the app needs
+    a background callback manager.
+
+    Args:
+        app (dash.Dash): Dashboard application.
+        dataset_cache (DatasetCache): Cache of parsed uploads.
+        result_cache (diskcache.Cache): Disk cache holding analysis results for export.
+        upload_pool (Executor): Pool parsing the files of a multi-file upload.
+        read_csv (callable): Turns the bytes of a CSV file into a DataFrame.
+        read_excel (callable): Turns the bytes of an Excel file into a DataFrame.
+        gene_column (str): Name of the gene column.
+        sequence_column (str): Name of the sequence column.
+        length_column (str): Name of the length column.
+        source_column (str): Column recording the file each row came from.
+        namespace (str): Name of this app's readers; dashboards parsing the same files differently
+            must use different namespaces, since their datasets and results share caches by id.
+    """
+    # Callback to handle file upload and display its content
+    @app.callback(
+        Output('output-data-upload', 'children'),
+        Output('dataset-id', 'data'),
+        Output('genomic-data-table', 'columns'),
+        Output('genomic-data-table', 'page_current'),
+        # A new dataset invalidates the previous analysis, so its panel and export are cleared
+        Output('analysis-results', 'children', allow_duplicate=True),
+        Output('analysis-result-id', 'data', allow_duplicate=True),
+        Input('upload-data', 'contents'),
+        State('upload-data', 'filename'),
+        State('upload-data', 'last_modified'),
+        prevent_initial_call=True  # This prevents the callback from running on startup
+    )
+    def update_output(contents, filename, last_modified):
+        if contents is None:
+            # No file was uploaded, return empty Div
+            return html.Div(), dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
+
+        if not isinstance(contents, list):
+            contents, filename, last_modified = [contents], [filename], [last_modified]
+        last_modified = last_modified or [None] * len(contents)
+
+        # Decode and parse every uploaded file concurrently
+        results = list(upload_pool.map(
+            lambda *args: parse_upload(*args, dataset_cache, read_csv, read_excel, namespace), contents, filename, last_modified,
+        ))
+        report = render_upload_report(results)
+        parsed = [result for result in results if result['error'] is None]
+        if not parsed:
+            return html.Div([report]), dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
+
+        try:
+            # The combined dataset is cached under the hashes and names of the files it was built from,
+            # since the names are part of the data in the source column
+            dataset_id = DatasetCache.content_id('\0'.join(
+                f"{result['dataset_id']}:{result['filename']}" for result in parsed
+            ).encode(), namespace)
+            df = dataset_cache.get(dataset_id)
+            if df is None:
+                df = pd.concat(
+                    [result['data'].assign(**{source_column: result['filename']}) for result in parsed],
+                    ignore_index=True,
+                )
+            # Keep the data on the server; the table requests one page at a time
+            dataset_cache.put(dataset_id, df)
+            columns = [{'name': i, 'id': i} for i in df.columns]
+        except Exception as e:
+            return (
+                html.Div([report, html.Div(f'An error occurred while processing the files: {e}')]),
+                dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
+            )
+
+        # Generate visualization; data the charts cannot use still reaches the table
+        try:
+            if gene_column in df and sequence_column in df:
+                figures = build_figures(df, gene_column, sequence_column, length_column)
+                visualization = html.Div([dcc.Graph(figure=figure) for figure in figures])
+            else:
+                visualization = html.Div(f"{gene_column} and/or {sequence_column} columns not found in the uploaded files.")
+        except Exception as e:
+            visualization = html.Div(f'The charts could not be drawn: {e}')
+
+        return html.Div([report, visualization]), dataset_id, columns, 0, None, None
+
+    # Callback to serve the visible page of the server-held dataset
+    @app.callback(
+        Output('genomic-data-table', 'data'),
+        Output('genomic-data-table', 'page_count'),
+        Input('genomic-data-table', 'page_current'),
+        Input('genomic-data-table', 'page_size'),
+        Input('genomic-data-table', 'sort_by'),
+        Input('genomic-data-table', 'filter_query'),
+        Input('dataset-id', 'data'),
+    )
+    def update_table(page_current, page_size, sort_by, filter_query, dataset_id):
+        df = dataset_cache.get(dataset_id)
+        if df is None:
+            return [], 1
+        return page_dataframe(df, page_current, page_size, sort_by, filter_query)
+
+    # Background callback running the selected analysis on the current dataset; clicking again
+    # with the same dataset and analysis type reuses the cached result
+    @app.callback(
+        Output('analysis-results', 'children'),
+        Output('analysis-result-id', 'data'),
+        Input('new-analysis-button', 'n_clicks'),
+        State('analysis-type-dropdown', 'value'),
+        State('dataset-id', 'data'),
+        background=True,
+        running=[
+            (Output('new-analysis-button', 'disabled'), True, False),
+            (Output('cancel-analysis-button', 'disabled'), False, True),
+        ],
+        cancel=[Input('cancel-analysis-button', 'n_clicks')],
+        progress=[Output('analysis-progress', 'value'), Output('analysis-progress', 'max')],
+        cache_args_to_ignore=[0],
+        prevent_initial_call=True
+    )
+    def run_analysis(set_progress, n_clicks, analysis_type, dataset_id):
+        df = dataset_cache.get(dataset_id)
+        if df is None:
+            return html.Div('Upload a dataset before starting an analysis.'), None
+
+        def report_progress(done, total):
+            set_progress((str(done), str(total)))
+
+        result = analyze_genomics_frame(
+            df, analysis_type, gene_column=gene_column, sequence_column=sequence_column,
+            length_column=length_column, on_progress=report_progress,
+        )
+        # Results are kept in the shared disk cache so the server process can export them
+        result_id = f'{dataset_id}-{analysis_type}'
+        result_cache.set(('analysis-result', result_id), result, expire=24 * 60 * 60)
+        return render_analysis_result(result, analysis_type), result_id
+
+    # Route streaming an uploaded dataset or analysis result straight from the server-side caches,
+    # so exports never pass through the JSON callback channel or sit in memory as one payload
+    @app.server.route('/download/<source>/<item_id>')
+    def download_results(source, item_id):
+        export_format = flask.request.args.get('format', 'csv')
+        if export_format not in EXPORT_FORMATS or not item_id.replace('-', '').isalnum():
+            flask.abort(400)
+        if source == 'dataset':
+            df = dataset_cache.get(item_id)
+        elif source == 'analysis':
+            df = result_cache.get(('analysis-result', item_id))
+        else:
+            df = None
+        if df is None:
+            flask.abort(404)
+        extension, mimetype = EXPORT_FORMATS[export_format]
+        return flask.Response(
+            iter_export_chunks(df, export_format),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename="genomics_{source}_{item_id}.{extension}"'},
+        )
+
+    app.clientside_callback(
+        DOWNLOAD_CLIENTSIDE_CALLBACK,
+        Output('download-trigger', 'data'),
+        Input('download-button', 'n_clicks'),
+        State('analysis-result-id', 'data'),
+        State('dataset-id', 'data'),
+        State('export-format-dropdown', 'value'),
+        prevent_initial_call=True
+    )
+
+
+def run_production(server, host: str, port: int, workers: int, threads: int) -> None:
+    """
+    Serves a Dash app's Flask server under gunicorn with several worker processes and threads.
+
+    Args:
+        server (flask.Flask): The app.server of a Dash application.
+        host (str): Address to bind.
+        port (int): Port to bind.
+        workers (int): Number of worker processes.
+        threads (int): Number of threads per worker.
+    """
+    from flask_compress import Compress
+    from gunicorn.app.base import BaseApplication
+
+    # Compress callback responses and let browsers cache static assets
+    Compress(server)
+    server.config['SEND_FILE_MAX_AGE_DEFAULT'] = ASSET_MAX_AGE
+
+    class DashApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('preload_app', True)
+
+        def load(self):
+            return server
+
+    DashApplication().run()
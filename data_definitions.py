@@ -0,0 +1,13 @@
+# Importable name for "Genomics Data Functions.py"; its file name contains spaces, so the
+# dashboards import it through this module, which loads the file by path
+import importlib.util
+import os
+import sys
+
+_spec = importlib.util.spec_from_file_location(
+    __name__, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Genomics Data Functions.py')
+)
+_module = importlib.util.module_from_spec(_spec)
+# Registered before running so pickled callbacks and classes resolve to this same module
+sys.modules[__name__] = _module
+_spec.loader.exec_module(_module)